@@ -0,0 +1,86 @@
+"""
+Non-blocking prompts for the async demos.
+
+Rich's Prompt.ask calls input(), which blocks the event loop while the user is
+typing. These helpers use prompt_toolkit's prompt_async when it is installed and
+stdin is a terminal, and otherwise run the Rich prompt in a worker thread, so
+background tasks keep running while the demos wait for input.
+"""
+
+import asyncio
+import sys
+from typing import Optional, Sequence
+
+from rich.console import Console
+from rich.prompt import Confirm, Prompt
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.patch_stdout import patch_stdout
+    from prompt_toolkit.validation import Validator
+except ImportError:
+    PromptSession = None
+
+_session = None
+
+
+def _use_prompt_toolkit() -> bool:
+    """Return True when prompt_toolkit is installed and can drive the terminal."""
+    return PromptSession is not None and sys.stdin.isatty() and sys.stdout.isatty()
+
+
+def _get_session() -> "PromptSession":
+    """Return the process-wide prompt session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = PromptSession()
+    return _session
+
+
+async def ask(
+    prompt: str,
+    choices: Optional[Sequence[str]] = None,
+    default: Optional[str] = None,
+    console: Optional[Console] = None
+) -> str:
+    """Ask for a line of input, optionally restricted to choices, without blocking the loop."""
+    if not _use_prompt_toolkit():
+        kwargs = {"console": console}
+        if choices is not None:
+            kwargs["choices"] = list(choices)
+        if default is not None:
+            kwargs["default"] = default
+        return await asyncio.to_thread(Prompt.ask, prompt, **kwargs)
+
+    message = prompt
+    if choices is not None:
+        message += f" [{'/'.join(choices)}]"
+    if default is not None:
+        message += f" ({default})"
+    message += ": "
+
+    validator = None
+    if choices is not None:
+        allowed = set(choices)
+        validator = Validator.from_callable(
+            lambda text: text.strip() in allowed or (default is not None and not text.strip()),
+            error_message="Please select one of the available options"
+        )
+
+    # patch_stdout keeps output from background tasks above the prompt line
+    with patch_stdout():
+        answer = (await _get_session().prompt_async(message, validator=validator)).strip()
+    return default if not answer and default is not None else answer
+
+
+async def confirm(prompt: str, default: Optional[bool] = None, console: Optional[Console] = None) -> bool:
+    """Ask a yes/no question without blocking the loop; with no default an answer is required."""
+    if not _use_prompt_toolkit():
+        kwargs = {"console": console}
+        if default is not None:
+            kwargs["default"] = default
+        return await asyncio.to_thread(Confirm.ask, prompt, **kwargs)
+
+    answer_default = None if default is None else ("y" if default else "n")
+    answer = await ask(prompt, choices=("y", "n"), default=answer_default, console=console)
+    return answer.lower() == "y"
@@ -6,33 +6,286 @@ This demo compares research quality across different model providers
 and configurations to showcase the flexibility of the system.
 """
 
+import argparse
 import asyncio
+import contextvars
+import hashlib
 import os
 import sys
 import time
 from pathlib import Path
-from typing import Dict, Any, List
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.panel import Panel
-from rich.table import Table
-from rich.layout import Layout
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Protocol
 import json
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from open_deep_research.deep_researcher import deep_researcher
-from open_deep_research.configuration import Configuration, SearchAPI
+from connection_pool import PooledTavilyConnections
+from filenames import safe_filename
+from json_io import dumps_line
+
+# Rich and open_deep_research are imported where they are used so that
+# --help and the "no API keys" exit don't pay for loading LangChain and
+# every provider SDK.
+
+# Concurrent research runs allowed per provider, sized to typical account quotas
+PROVIDER_CONCURRENCY = {"OpenAI": 4, "Anthropic": 3, "Google": 3, "Mixed": 3}
+
+# deep_researcher returns final-report failures as the report text itself
+_REPORT_ERROR_PREFIX = "Error generating final report"
+
+DEFAULT_TOPIC = "The impact of large language models on software development productivity"
+
+
+def _preview(text: str, n: int) -> str:
+    """Return text truncated to n characters, marking truncation with an ellipsis."""
+    return text if len(text) <= n else text[:n] + "..."
+
+
+class CacheBackend(Protocol):
+    """Storage backend for cached research results."""
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the value stored under key, or None if there is none."""
+        ...
+    
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store value under key, replacing any previous value."""
+        ...
+
+
+class FileCacheBackend:
+    """Cache backend storing one JSON blob per key on disk."""
+    
+    def __init__(self, cache_dir: Path = Path("demo_results/cache")):
+        self.cache_dir = cache_dir
+    
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self.cache_dir / f"{key}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write(self, key: str, value: Dict[str, Any]):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_dir / f"{key}.json", 'w', encoding='utf-8') as f:
+            json.dump(value, f)
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read the JSON blob for key in a worker thread; missing or corrupt files read as None."""
+        return await asyncio.to_thread(self._read, key)
+    
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Write the JSON blob for key in a worker thread."""
+        await asyncio.to_thread(self._write, key, value)
+
+
+class LLMResultCache:
+    """Cache of final reports keyed by configuration and research topic.
+    
+    Topics are normalized (case, punctuation and whitespace) before hashing so
+    trivially different phrasings of the same topic share an entry.
+    """
+    
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = backend or FileCacheBackend()
+    
+    @staticmethod
+    def _normalize_topic(topic: str) -> str:
+        words = "".join(c if c.isalnum() else " " for c in topic.casefold()).split()
+        return " ".join(words)
+    
+    def cache_key(self, configurable: Dict[str, Any], topic: str) -> str:
+        """Return the cache key for a configuration and a normalized research topic."""
+        payload = json.dumps(
+            {"cfg": configurable, "topic": self._normalize_topic(topic)},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result entry for key, or None on a miss."""
+        return await self.backend.get(key)
+    
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a result entry under key."""
+        await self.backend.set(key, value)
+
+
+# Result handed to coalesced callers when the call they were waiting on was cancelled
+_LEADER_CANCELLED = object()
+
+
+class SubcallCache:
+    """Disk-backed cache for research sub-calls shared across configurations.
+    
+    Concurrent requests for the same key are coalesced: the first caller runs
+    the call and every other caller awaits its result. If that first call is
+    cancelled, the waiting callers retry it instead of being cancelled too.
+    """
+    
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = backend or FileCacheBackend(Path("demo_results/subcall_cache"))
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    @staticmethod
+    def cache_key(name: str, args: Dict[str, Any]) -> str:
+        """Return the cache key for a sub-call name and its JSON-serializable arguments."""
+        payload = json.dumps({"name": name, "args": args}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    async def get_or_call(
+        self,
+        name: str,
+        args: Dict[str, Any],
+        call: Callable[[], Awaitable[Any]],
+        should_cache: Callable[[Any], bool] = lambda value: True
+    ) -> Any:
+        """Return the cached result of a sub-call, running call() on a miss.
+        
+        Concurrent callers with the same key share one in-flight call. A fresh
+        result is stored only when should_cache(result) is true; it is still
+        returned to every caller either way. Exceptions from the call reach every
+        waiting caller; if the running call is cancelled, waiters retry it instead.
+        """
+        key = self.cache_key(name, args)
+        
+        inflight = self._inflight.get(key)
+        while inflight is not None:
+            value = await asyncio.shield(inflight)
+            if value is not _LEADER_CANCELLED:
+                return value
+            # The leader's own run was cancelled; the first waiter to get here takes over
+            inflight = self._inflight.get(key)
+        
+        # Register before the first await so identical calls coalesce onto this one
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            cached = await self.backend.get(key)
+            if cached is not None:
+                value = cached["value"]
+            else:
+                value = await call()
+                if should_cache(value):
+                    await self.backend.set(key, {"value": value})
+        except asyncio.CancelledError:
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved when nobody else is waiting
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+
+# Summarization model of the run currently executing in this task context
+_summarization_model: contextvars.ContextVar[str] = contextvars.ContextVar("summarization_model", default="")
+
+
+class InstrumentedCachingRunner:
+    """Run deep_researcher with Tavily searches and webpage summaries cached.
+    
+    While installed, the search and summarization helpers in
+    open_deep_research.utils are wrapped so identical calls made by different
+    configurations for the same topic are served from the SubcallCache.
+    """
+    
+    def __init__(self, cache: Optional[SubcallCache] = None):
+        self.cache = cache or SubcallCache()
+        self._originals: Dict[str, Any] = {}
+    
+    def install(self):
+        """Wrap the search and summarization helpers."""
+        if self._originals:
+            return
+        
+        from open_deep_research import utils as research_utils
+        
+        original_search = research_utils.tavily_search_async
+        original_summarize = research_utils.summarize_webpage
+        self._originals = {"tavily_search_async": original_search, "summarize_webpage": original_summarize}
+        
+        async def cached_search(search_queries, max_results=5, topic="general", include_raw_content=True, config=None):
+            args = {
+                "queries": list(search_queries),
+                "max_results": max_results,
+                "topic": topic,
+                "include_raw_content": include_raw_content
+            }
+            return await self.cache.get_or_call(
+                "tavily_search",
+                args,
+                lambda: original_search(
+                    search_queries,
+                    max_results=max_results,
+                    topic=topic,
+                    include_raw_content=include_raw_content,
+                    config=config
+                )
+            )
+        
+        async def cached_summarize(model, webpage_content):
+            args = {
+                "model": _summarization_model.get(),
+                "content": hashlib.sha256(webpage_content.encode("utf-8")).hexdigest()
+            }
+            # summarize_webpage returns the raw content on failure; don't cache that
+            return await self.cache.get_or_call(
+                "summarize_webpage",
+                args,
+                lambda: original_summarize(model, webpage_content),
+                should_cache=lambda summary: summary != webpage_content
+            )
+        
+        research_utils.tavily_search_async = cached_search
+        research_utils.summarize_webpage = cached_summarize
+    
+    def uninstall(self):
+        """Restore the original helpers."""
+        from open_deep_research import utils as research_utils
+        
+        for name, original in self._originals.items():
+            setattr(research_utils, name, original)
+        self._originals = {}
+    
+    async def ainvoke(self, research_input: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        """Run deep_researcher, tagging sub-calls with this run's summarization model."""
+        from open_deep_research.deep_researcher import deep_researcher
+        
+        _summarization_model.set(config["configurable"].get("summarization_model", ""))
+        return await deep_researcher.ainvoke(research_input, config=config)
 
 
 class ModelComparisonDemo:
     """Demo comparing different model providers and configurations."""
     
-    def __init__(self):
-        self.console = Console()
+    def __init__(self, max_parallel: int = 3, use_cache: bool = True, write_markdown: bool = False):
+        from rich.console import Console
+        
+        # Output is plain status lines and tables; skip Rich's repr highlighter
+        self.console = Console(highlight=False, soft_wrap=True, log_time=False)
+        self.max_parallel = max_parallel
+        self.cache = LLMResultCache() if use_cache else None
+        self.use_cache = use_cache
+        self.runner = InstrumentedCachingRunner()
+        self.connections = PooledTavilyConnections()
+        self.reports_dir = Path("demo_results/comparisons/reports")
+        self.log_path = Path("demo_results/comparisons.jsonl")
+        self.write_markdown = write_markdown
         self.comparison_configs = self._get_comparison_configs()
+        self._provider_sems = {
+            provider: asyncio.Semaphore(PROVIDER_CONCURRENCY.get(provider, 3))
+            for provider in {c["provider"] for c in self.comparison_configs}
+        }
         
     def _get_comparison_configs(self) -> List[Dict[str, Any]]:
         """Get different configurations for comparison."""
@@ -43,6 +296,11 @@ class ModelComparisonDemo:
         has_anthropic = bool(os.getenv("ANTHROPIC_API_KEY"))
         has_google = bool(os.getenv("GOOGLE_API_KEY"))
         
+        if not (has_openai or has_anthropic or has_google):
+            return configs
+        
+        from open_deep_research.configuration import Configuration, SearchAPI
+        
         if has_openai:
             configs.extend([
                 {
@@ -121,6 +379,10 @@ class ModelComparisonDemo:
                 )
             })
         
+        # Serialize each configuration once; every run reuses the same dict
+        for config_info in configs:
+            config_info["configurable"] = config_info["config"].model_dump()
+        
         return configs
     
     def display_intro(self):
@@ -144,123 +406,227 @@ and configurations using the same research topic.
 • Google (Gemini 1.5 Pro/Flash)
 • Mixed provider configurations
         """
+        from rich.panel import Panel
+        
         self.console.print(Panel(intro_text, title="Model Comparison", border_style="blue"))
     
+    def _write_text(self, path: Path, content: str):
+        """Write a text file, creating its parent directory if needed."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    
+    def _append_bytes(self, path: Path, data: bytes):
+        """Append to a binary file, creating its parent directory if needed."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'ab') as f:
+            f.write(data)
+    
+    async def _persist_report(self, config_name: str, report: str, topic_slug: str, timestamp: int) -> Dict[str, Any]:
+        """Persist a final report and return the fields kept in memory for it."""
+        safe_name = safe_filename(config_name, 40)
+        # The topic keeps reports of topics finishing in the same second apart
+        path = self.reports_dir / f"{topic_slug}_{safe_name}_{timestamp}.md"
+        await asyncio.to_thread(self._write_text, path, report)
+        
+        return {
+            "final_report_path": str(path),
+            "final_report_length": len(report),
+            "final_report_preview": _preview(report, 500)
+        }
+    
     async def run_comparison_research(self, topic: str) -> List[Dict[str, Any]]:
-        """Run research using all available configurations."""
-        results = []
+        """Run research using all available configurations concurrently.
         
+        Final reports are written to disk as soon as each run finishes; only
+        their path, length and a short preview are kept in the results.
+        """
         total_configs = len(self.comparison_configs)
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console
-        ) as progress:
-            main_task = progress.add_task("Running model comparison...", total=total_configs)
+        timestamp = int(time.time())
+        topic_slug = safe_filename(topic, 40)
+        no_report = {"final_report_path": None, "final_report_length": 0, "final_report_preview": ""}
+        
+        async def _run_one(config_info: Dict[str, Any]) -> Dict[str, Any]:
+            config_name = config_info["name"]
+            provider = config_info["provider"]
+            config = config_info["config"]
+            configurable = config_info["configurable"]
             
-            for i, config_info in enumerate(self.comparison_configs):
-                config_name = config_info["name"]
-                provider = config_info["provider"]
-                config = config_info["config"]
+            def _failed(e: Exception, duration: float) -> Dict[str, Any]:
+                self.console.print(f"[red]✗[/red] {config_name} failed: {str(e)}")
                 
-                progress.update(main_task, description=f"Testing {config_name}...")
-                
-                start_time = time.time()
+                return {
+                    "config_name": config_name,
+                    "provider": provider,
+                    "config": config,
+                    **no_report,
+                    "duration": duration,
+                    "success": False,
+                    "error": str(e),
+                    "cached": False
+                }
+            
+            cache_key = None
+            if self.cache:
+                cache_key = self.cache.cache_key(configurable, topic)
+                try:
+                    cached = await self.cache.get(cache_key)
+                    # An entry without a report string is treated as a miss and overwritten by the live run
+                    if isinstance(cached, dict) and isinstance(cached.get("final_report"), str):
+                        report_fields = await self._persist_report(config_name, cached["final_report"], topic_slug, timestamp)
+                        self.console.print(f"[green]✓[/green] {config_name} loaded from cache")
+                        return {
+                            "config_name": config_name,
+                            "provider": provider,
+                            "config": config,
+                            **report_fields,
+                            "duration": 0.0,
+                            "success": True,
+                            "error": None,
+                            "cached": True
+                        }
+                except Exception as e:
+                    return _failed(e, 0.0)
+            
+            # Take the provider slot first so waiting runs don't hold a global slot
+            async with self._provider_sems[provider], semaphore:
+                start_time = time.perf_counter()
                 
                 try:
                     research_input = {
                         "messages": [{"role": "user", "content": topic}]
                     }
                     
-                    result = await deep_researcher.ainvoke(
+                    result = await self.runner.ainvoke(
                         research_input,
-                        config={"configurable": config.model_dump()}
+                        config={"configurable": configurable}
                     )
                     
-                    end_time = time.time()
+                    end_time = time.perf_counter()
                     duration = end_time - start_time
                     
-                    results.append({
-                        "config_name": config_name,
-                        "provider": provider,
-                        "config": config,
-                        "result": result,
-                        "duration": duration,
-                        "success": True,
-                        "error": None
-                    })
+                    report_fields = no_report
+                    if result and "final_report" in result:
+                        report = result["final_report"]
+                        report_fields = await self._persist_report(config_name, report, topic_slug, timestamp)
+                        # A failed final report is transient (rate limit, timeout); don't replay it
+                        if cache_key and not report.startswith(_REPORT_ERROR_PREFIX):
+                            await self.cache.set(cache_key, {"final_report": report, "duration": duration})
                     
                     self.console.print(f"[green]✓[/green] {config_name} completed in {duration:.1f}s")
-                
-                except Exception as e:
-                    end_time = time.time()
-                    duration = end_time - start_time
                     
-                    results.append({
+                    return {
                         "config_name": config_name,
                         "provider": provider,
                         "config": config,
-                        "result": None,
+                        **report_fields,
                         "duration": duration,
-                        "success": False,
-                        "error": str(e)
-                    })
-                    
-                    self.console.print(f"[red]✗[/red] {config_name} failed: {str(e)}")
+                        "success": True,
+                        "error": None,
+                        "cached": False
+                    }
                 
-                progress.update(main_task, advance=1)
+                except Exception as e:
+                    return _failed(e, time.perf_counter() - start_time)
         
-        return results
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=self.console,
+            refresh_per_second=4,
+            disable=not self.console.is_terminal
+        ) as progress:
+            main_task = progress.add_task(
+                f"Running model comparison ({min(self.max_parallel, total_configs)} at a time)...",
+                total=total_configs
+            )
+            
+            if self.use_cache:
+                self.runner.install()
+            try:
+                tasks = [asyncio.create_task(_run_one(config_info)) for config_info in self.comparison_configs]
+                for completed in asyncio.as_completed(tasks):
+                    await completed
+                    progress.update(main_task, advance=1)
+            finally:
+                self.runner.uninstall()
+        
+        # Keep results in configuration order regardless of completion order
+        return [task.result() for task in tasks]
     
     def analyze_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze and compare the results."""
-        analysis = {
-            "total_configs": len(results),
-            "successful_configs": len([r for r in results if r["success"]]),
-            "failed_configs": len([r for r in results if not r["success"]]),
-            "average_duration": sum(r["duration"] for r in results if r["success"]) / max(1, len([r for r in results if r["success"]])),
-            "fastest_config": None,
-            "slowest_config": None,
-            "longest_report": None,
-            "shortest_report": None,
-            "provider_performance": {}
-        }
+        """Analyze and compare the results in a single pass."""
+        successful = 0
+        failed = 0
+        timed = 0
+        total_duration = 0.0
+        fastest = slowest = None
+        longest = shortest = None
+        longest_len = -1
+        shortest_len = float("inf")
+        provider_stats = {}
         
-        successful_results = [r for r in results if r["success"]]
-        
-        if successful_results:
-            # Find fastest and slowest
-            analysis["fastest_config"] = min(successful_results, key=lambda x: x["duration"])
-            analysis["slowest_config"] = max(successful_results, key=lambda x: x["duration"])
+        for result in results:
+            provider = result["provider"]
+            stats = provider_stats.get(provider)
+            if stats is None:
+                stats = provider_stats[provider] = {"total": 0, "count": 0, "timed": 0, "total_duration": 0.0, "reports": []}
+            stats["total"] += 1
             
-            # Find longest and shortest reports
-            results_with_reports = [r for r in successful_results if r["result"] and "final_report" in r["result"]]
-            if results_with_reports:
-                analysis["longest_report"] = max(results_with_reports, key=lambda x: len(x["result"]["final_report"]))
-                analysis["shortest_report"] = min(results_with_reports, key=lambda x: len(x["result"]["final_report"]))
+            if not result["success"]:
+                failed += 1
+                continue
             
-            # Provider performance
-            provider_stats = {}
-            for result in successful_results:
-                provider = result["provider"]
-                if provider not in provider_stats:
-                    provider_stats[provider] = {"count": 0, "total_duration": 0, "reports": []}
-                
-                provider_stats[provider]["count"] += 1
-                provider_stats[provider]["total_duration"] += result["duration"]
+            successful += 1
+            stats["count"] += 1
+            
+            # Cached results report a 0.0 s duration; keep them out of the timings
+            if not result.get("cached"):
+                duration = result["duration"]
+                timed += 1
+                total_duration += duration
+                stats["timed"] += 1
+                stats["total_duration"] += duration
                 
-                if result["result"] and "final_report" in result["result"]:
-                    provider_stats[provider]["reports"].append(len(result["result"]["final_report"]))
+                if fastest is None or duration < fastest["duration"]:
+                    fastest = result
+                if slowest is None or duration > slowest["duration"]:
+                    slowest = result
             
-            for provider, stats in provider_stats.items():
-                analysis["provider_performance"][provider] = {
-                    "average_duration": stats["total_duration"] / stats["count"],
-                    "average_report_length": sum(stats["reports"]) / len(stats["reports"]) if stats["reports"] else 0,
-                    "success_rate": stats["count"] / len([r for r in results if r["provider"] == provider])
-                }
+            if result["final_report_path"]:
+                report_length = result["final_report_length"]
+                stats["reports"].append(report_length)
+                if report_length > longest_len:
+                    longest_len, longest = report_length, result
+                if report_length < shortest_len:
+                    shortest_len, shortest = report_length, result
+        
+        analysis = {
+            "total_configs": len(results),
+            "successful_configs": successful,
+            "failed_configs": failed,
+            "timed_configs": timed,
+            "average_duration": total_duration / timed if timed else None,
+            "fastest_config": fastest,
+            "slowest_config": slowest,
+            "longest_report": longest,
+            "shortest_report": shortest,
+            "provider_performance": {}
+        }
+        
+        for provider, stats in provider_stats.items():
+            if not stats["count"]:
+                continue
+            analysis["provider_performance"][provider] = {
+                "average_duration": stats["total_duration"] / stats["timed"] if stats["timed"] else None,
+                "average_report_length": sum(stats["reports"]) / len(stats["reports"]) if stats["reports"] else 0,
+                "success_rate": stats["count"] / stats["total"]
+            }
         
         return analysis
     
@@ -270,38 +636,49 @@ and configurations using the same research topic.
         self.console.print("="*80)
         
         # Summary table
-        summary_table = Table(title="Performance Summary", show_header=True, header_style="bold magenta")
-        summary_table.add_column("Configuration", style="cyan", min_width=20)
-        summary_table.add_column("Provider", style="blue", min_width=12)
-        summary_table.add_column("Status", style="green", min_width=10)
-        summary_table.add_column("Duration (s)", style="yellow", min_width=12)
-        summary_table.add_column("Report Length", style="white", min_width=15)
-        
+        rows = []
         for result in results:
             status = "✓ Success" if result["success"] else "✗ Failed"
             duration = f"{result['duration']:.1f}"
             
-            if result["success"] and result["result"] and "final_report" in result["result"]:
-                report_length = len(result["result"]["final_report"])
-                report_length_str = f"{report_length:,} chars"
+            if result["final_report_path"]:
+                report_length_str = f"{result['final_report_length']:,} chars"
             else:
                 report_length_str = "N/A"
             
-            summary_table.add_row(
-                result["config_name"],
-                result["provider"],
-                status,
-                duration,
-                report_length_str
-            )
+            rows.append((result["config_name"], result["provider"], status, duration, report_length_str))
         
-        self.console.print(summary_table)
+        if self.console.is_terminal:
+            from rich import box
+            from rich.table import Table
+            
+            summary_table = Table(
+                title="Performance Summary",
+                show_header=True,
+                header_style="bold magenta",
+                box=box.SIMPLE,
+                pad_edge=False
+            )
+            summary_table.add_column("Configuration", style="cyan", min_width=20)
+            summary_table.add_column("Provider", style="blue", min_width=12)
+            summary_table.add_column("Status", style="green", min_width=10)
+            summary_table.add_column("Duration (s)", style="yellow", min_width=12)
+            summary_table.add_column("Report Length", style="white", min_width=15)
+            
+            for row in rows:
+                summary_table.add_row(*row)
+            
+            self.console.print(summary_table)
+        else:
+            # Piped or CI output: skip Rich's table layout and emit grep-friendly TSV
+            self._write_plain_summary(rows)
         
         # Analysis summary
         if analysis["successful_configs"] > 0:
             self.console.print(f"\n[bold blue]📈 Analysis Summary:[/bold blue]")
             self.console.print(f"• Successful configurations: {analysis['successful_configs']}/{analysis['total_configs']}")
-            self.console.print(f"• Average duration: {analysis['average_duration']:.1f} seconds")
+            if analysis["average_duration"] is not None:
+                self.console.print(f"• Average duration: {analysis['average_duration']:.1f} seconds")
             
             if analysis["fastest_config"]:
                 self.console.print(f"• Fastest: {analysis['fastest_config']['config_name']} ({analysis['fastest_config']['duration']:.1f}s)")
@@ -313,40 +690,69 @@ and configurations using the same research topic.
             if analysis["provider_performance"]:
                 self.console.print(f"\n[bold yellow]🏆 Provider Performance:[/bold yellow]")
                 for provider, stats in analysis["provider_performance"].items():
-                    self.console.print(f"• {provider}: {stats['average_duration']:.1f}s avg, {stats['average_report_length']:.0f} chars avg")
+                    duration = "cached" if stats["average_duration"] is None else f"{stats['average_duration']:.1f}s avg"
+                    self.console.print(f"• {provider}: {duration}, {stats['average_report_length']:.0f} chars avg")
         
         # Show sample reports
-        successful_results = [r for r in results if r["success"] and r["result"] and "final_report" in r["result"]]
+        successful_results = [r for r in results if r["final_report_path"]]
         if successful_results:
             self.console.print(f"\n[bold blue]📄 Sample Report Previews:[/bold blue]")
             
+            from rich.panel import Panel
+            
             for i, result in enumerate(successful_results[:3]):  # Show first 3 successful results
-                preview = result["result"]["final_report"][:300] + "..." if len(result["result"]["final_report"]) > 300 else result["result"]["final_report"]
-                self.console.print(Panel(
-                    preview,
-                    title=f"{result['config_name']} ({result['duration']:.1f}s)",
-                    border_style="blue"
-                ))
-    
-    def save_comparison_results(self, results: List[Dict[str, Any]], analysis: Dict[str, Any], topic: str):
-        """Save detailed comparison results."""
-        # Create comparison results directory
-        results_dir = Path("demo_results/comparisons")
-        results_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Generate filename
-        safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_topic = safe_topic.replace(' ', '_')[:40]
+                title = f"{result['config_name']} ({result['duration']:.1f}s)"
+                preview = _preview(result["final_report_preview"], 300)
+                if self.console.is_terminal:
+                    self.console.print(Panel(preview, title=title, border_style="blue"))
+                else:
+                    print(f"=== {title} ===\n{preview}\n")
+    
+    def _write_plain_summary(self, rows: List[tuple]):
+        """Print the performance summary as tab-separated values."""
+        print("\t".join(("Configuration", "Provider", "Status", "Duration (s)", "Report Length")))
+        for row in rows:
+            print("\t".join(row))
+    
+    async def save_comparison_results(self, results: List[Dict[str, Any]], analysis: Dict[str, Any], topic: str):
+        """Save detailed comparison results without blocking the event loop.
+        
+        Every comparison is appended as one line to the comparisons.jsonl log;
+        a per-run Markdown report is written only when write_markdown is set.
+        """
         timestamp = int(time.time())
         
-        # Save detailed results as JSON
-        json_filename = results_dir / f"comparison_{safe_topic}_{timestamp}.json"
+        # Both builders are pure; run them in worker threads alongside each other
+        builders = [asyncio.to_thread(self._build_json_payload, results, analysis, topic, timestamp)]
+        if self.write_markdown:
+            md_filename = self._build_markdown_path(topic, timestamp)
+            builders.append(asyncio.to_thread(self._build_markdown, results, analysis, topic, timestamp))
+        
+        payloads = await asyncio.gather(*builders)
+        
+        writes = [asyncio.to_thread(self._append_bytes, self.log_path, payloads[0])]
+        if self.write_markdown:
+            writes.append(asyncio.to_thread(self._write_text, md_filename, payloads[1]))
         
+        await asyncio.gather(*writes)
+        
+        self.console.print(f"[green]✓[/green] Comparison results saved to:")
+        self.console.print(f"  JSON Lines log: {self.log_path}")
+        if self.write_markdown:
+            self.console.print(f"  Markdown: {md_filename}")
+    
+    def _build_json_payload(self, results: List[Dict[str, Any]], analysis: Dict[str, Any], topic: str, timestamp: int) -> bytes:
+        """Build the JSON Lines record for one comparison."""
         # Prepare data for JSON (remove non-serializable parts)
+        # Result records carry Configuration objects; reference them by name instead
+        json_analysis = {
+            key: value["config_name"] if key in ("fastest_config", "slowest_config", "longest_report", "shortest_report") and value else value
+            for key, value in analysis.items()
+        }
         json_data = {
             "topic": topic,
             "timestamp": timestamp,
-            "analysis": analysis,
+            "analysis": json_analysis,
             "results": []
         }
         
@@ -357,60 +763,74 @@ and configurations using the same research topic.
                 "duration": result["duration"],
                 "success": result["success"],
                 "error": result["error"],
-                "report_length": len(result["result"]["final_report"]) if result["success"] and result["result"] and "final_report" in result["result"] else 0
+                "cached": result["cached"],
+                "report_length": result["final_report_length"],
+                "report_path": result["final_report_path"]
             }
             json_data["results"].append(json_result)
         
-        with open(json_filename, 'w') as f:
-            json.dump(json_data, f, indent=2)
-        
-        # Save markdown report
-        md_filename = results_dir / f"comparison_{safe_topic}_{timestamp}.md"
-        
-        content = f"# Model Comparison Report: {topic}\n\n"
-        content += f"Generated at: {time.ctime(timestamp)}\n\n"
-        
-        content += "## Summary\n\n"
-        content += f"- Total configurations tested: {analysis['total_configs']}\n"
-        content += f"- Successful runs: {analysis['successful_configs']}\n"
-        content += f"- Failed runs: {analysis['failed_configs']}\n"
-        content += f"- Average duration: {analysis['average_duration']:.1f} seconds\n\n"
+        return dumps_line(json_data)
+    
+    def _build_markdown_path(self, topic: str, timestamp: int) -> Path:
+        """Return the per-run Markdown report path for a topic."""
+        safe_topic = safe_filename(topic, 40)
+        return Path("demo_results/comparisons") / f"comparison_{safe_topic}_{timestamp}.md"
+    
+    def _build_markdown(self, results: List[Dict[str, Any]], analysis: Dict[str, Any], topic: str, timestamp: int) -> str:
+        """Build the Markdown comparison report."""
+        parts = [
+            f"# Model Comparison Report: {topic}\n\n",
+            f"Generated at: {time.ctime(timestamp)}\n\n",
+            "## Summary\n\n",
+            f"- Total configurations tested: {analysis['total_configs']}\n",
+            f"- Successful runs: {analysis['successful_configs']}\n",
+            f"- Failed runs: {analysis['failed_configs']}\n",
+        ]
+        if analysis["average_duration"] is not None:
+            parts.append(f"- Average duration: {analysis['average_duration']:.1f} seconds\n")
+        parts.append("\n## Configuration Results\n\n")
         
-        content += "## Configuration Results\n\n"
         for result in results:
-            content += f"### {result['config_name']}\n"
-            content += f"- Provider: {result['provider']}\n"
-            content += f"- Duration: {result['duration']:.1f} seconds\n"
-            content += f"- Status: {'Success' if result['success'] else 'Failed'}\n"
+            duration = "cached" if result['cached'] else f"{result['duration']:.1f} seconds"
+            parts.append(f"""### {result['config_name']}
+- Provider: {result['provider']}
+- Duration: {duration}
+- Status: {'Success' if result['success'] else 'Failed'}
+""")
             
-            if result['success'] and result['result'] and 'final_report' in result['result']:
-                content += f"- Report length: {len(result['result']['final_report']):,} characters\n"
-                content += f"\n#### Report Preview:\n"
-                preview = result['result']['final_report'][:500] + "..." if len(result['result']['final_report']) > 500 else result['result']['final_report']
-                content += f"```\n{preview}\n```\n"
+            report_path = result['final_report_path']
+            if report_path:
+                parts.append(f"""- Report length: {result['final_report_length']:,} characters
+- Full report: {report_path}
+
+#### Report Preview:
+```
+{result['final_report_preview']}
+```
+""")
             elif not result['success']:
-                content += f"- Error: {result['error']}\n"
+                parts.append(f"- Error: {result['error']}\n")
             
-            content += "\n"
+            parts.append("\n")
         
-        content += "## Analysis\n\n"
+        parts.append("## Analysis\n\n")
         if analysis["fastest_config"]:
-            content += f"**Fastest configuration:** {analysis['fastest_config']['config_name']} ({analysis['fastest_config']['duration']:.1f}s)\n\n"
+            parts.append(f"**Fastest configuration:** {analysis['fastest_config']['config_name']} ({analysis['fastest_config']['duration']:.1f}s)\n\n")
         
         if analysis["provider_performance"]:
-            content += "**Provider Performance:**\n"
+            parts.append("**Provider Performance:**\n")
             for provider, stats in analysis["provider_performance"].items():
-                content += f"- {provider}: {stats['average_duration']:.1f}s average duration\n"
+                if stats["average_duration"] is None:
+                    parts.append(f"- {provider}: cached results only\n")
+                else:
+                    parts.append(f"- {provider}: {stats['average_duration']:.1f}s average duration\n")
         
-        with open(md_filename, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        self.console.print(f"[green]✓[/green] Comparison results saved to:")
-        self.console.print(f"  JSON: {json_filename}")
-        self.console.print(f"  Markdown: {md_filename}")
+        return "".join(parts)
     
-    async def run_demo(self):
-        """Run the model comparison demo."""
+    async def run_demo(self, topics: Optional[List[str]] = None):
+        """Run the model comparison demo for one or more topics."""
+        topics = topics or [DEFAULT_TOPIC]
+
         self.display_intro()
         
         if not self.comparison_configs:
@@ -422,24 +842,24 @@ and configurations using the same research topic.
         for config in self.comparison_configs:
             self.console.print(f"• {config['name']} ({config['provider']})")
         
-        # Demo research topic
-        topic = "The impact of large language models on software development productivity"
-        
-        self.console.print(f"\n[bold yellow]Research Topic:[/bold yellow] {topic}")
-        self.console.print("This topic will be used to compare all available configurations.\n")
-        
+        # Search connections stay open across every topic and configuration
+        self.connections.install()
         try:
-            # Run comparison research
-            results = await self.run_comparison_research(topic)
-            
-            # Analyze results
-            analysis = self.analyze_results(results)
-            
-            # Display results
-            self.display_comparison_results(results, analysis, topic)
-            
-            # Save results
-            self.save_comparison_results(results, analysis, topic)
+            for topic in topics:
+                self.console.print(f"\n[bold yellow]Research Topic:[/bold yellow] {topic}")
+                self.console.print("This topic will be used to compare all available configurations.\n")
+                
+                # Run comparison research
+                results = await self.run_comparison_research(topic)
+                
+                # Analyze results
+                analysis = self.analyze_results(results)
+                
+                # Display results
+                self.display_comparison_results(results, analysis, topic)
+                
+                # Save results
+                await self.save_comparison_results(results, analysis, topic)
             
             self.console.print("\n[bold blue]🎉 Model comparison demo completed![/bold blue]")
             
@@ -447,12 +867,33 @@ and configurations using the same research topic.
             self.console.print("\n[yellow]Demo interrupted by user.[/yellow]")
         except Exception as e:
             self.console.print(f"[bold red]Error during comparison:[/bold red] {str(e)}")
+        finally:
+            await self.connections.aclose()
 
 
 async def main():
     """Main entry point for the comparison demo."""
-    demo = ModelComparisonDemo()
-    await demo.run_demo()
+    parser = argparse.ArgumentParser(description="Compare research quality across model providers.")
+    parser.add_argument(
+        "--with-markdown",
+        action="store_true",
+        help="also write a Markdown report for this run under demo_results/comparisons/"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore cached research results and sub-calls and run every configuration afresh"
+    )
+    parser.add_argument(
+        "--topic",
+        action="append",
+        dest="topics",
+        help=f"research topic to compare; repeat for several topics (default: {DEFAULT_TOPIC!r})"
+    )
+    args = parser.parse_args()
+    
+    demo = ModelComparisonDemo(use_cache=not args.no_cache, write_markdown=args.with_markdown)
+    await demo.run_demo(args.topics)
 
 
 if __name__ == "__main__":
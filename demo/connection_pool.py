@@ -0,0 +1,73 @@
+"""
+Shared HTTP connection pooling for the demos.
+
+Research runs issue many Tavily searches; keeping their connections open across
+searches, configurations and topics avoids a TCP and TLS handshake per request.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+
+class _BorrowedClient:
+    """Async context manager lending out a shared HTTP client without closing it."""
+    
+    def __init__(self, client):
+        self._client = client
+    
+    async def __aenter__(self):
+        return self._client
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class PooledTavilyConnections:
+    """Reuse one HTTP connection pool for every Tavily search.
+    
+    AsyncTavilyClient opens and closes a new httpx client for each request, and
+    tavily_search_async builds a new AsyncTavilyClient per call, so every search
+    pays a fresh TCP and TLS handshake. While installed, one client per API key
+    is kept and its HTTP client stays open until aclose() is awaited.
+    """
+    
+    def __init__(self):
+        self._original_cls = None
+        self._clients: Dict[Optional[str], Any] = {}
+        self._http_clients: List[Any] = []
+    
+    def install(self):
+        """Route tavily_search_async through pooled clients."""
+        if self._original_cls is not None:
+            return
+        
+        from open_deep_research import utils as research_utils
+        
+        original_cls = self._original_cls = research_utils.AsyncTavilyClient
+        
+        def pooled_client(api_key: Optional[str] = None, **kwargs):
+            client = self._clients.get(api_key)
+            if client is None:
+                client = original_cls(api_key=api_key, **kwargs)
+                # _client_creator is private to tavily-python; without it, fall back to an unpooled client
+                if not hasattr(client, "_client_creator"):
+                    return client
+                http_client = client._client_creator()
+                self._http_clients.append(http_client)
+                client._client_creator = lambda: _BorrowedClient(http_client)
+                self._clients[api_key] = client
+            return client
+        
+        research_utils.AsyncTavilyClient = pooled_client
+    
+    async def aclose(self):
+        """Restore the Tavily client class and close pooled connections."""
+        if self._original_cls is not None:
+            from open_deep_research import utils as research_utils
+            
+            research_utils.AsyncTavilyClient = self._original_cls
+            self._original_cls = None
+        
+        http_clients, self._http_clients = self._http_clients, []
+        self._clients = {}
+        await asyncio.gather(*(client.aclose() for client in http_clients))
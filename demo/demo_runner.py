@@ -6,241 +6,34 @@ This demo showcases the functionality and features of Open Deep Research
 without requiring actual API calls. Perfect for testing and demonstration.
 """
 
+import os
+import pickle
+import re
 import sys
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any
-from rich.console import Console
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from rich.console import Console, Group
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
+from rich.text import Text
 from rich.layout import Layout
-import json
 import time
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+from json_io import dumps_indented, loads
 
-class MockDemo:
-    """Mock demo for Open Deep Research without API calls."""
-    
-    def __init__(self):
-        self.console = Console()
-        self.demo_configs = self._load_demo_configs()
-        self.sample_results = self._load_sample_results()
-        
-    def _load_demo_configs(self) -> Dict[str, Dict[str, Any]]:
-        """Load demo configurations from the configs directory."""
-        configs = {}
-        config_dir = Path("demo/configs")
-        
-        if config_dir.exists():
-            for config_file in config_dir.glob("*.json"):
-                try:
-                    with open(config_file, 'r') as f:
-                        config_data = json.load(f)
-                        configs[config_file.stem] = config_data
-                except Exception as e:
-                    self.console.print(f"[yellow]Warning: Could not load {config_file}: {e}[/yellow]")
-        
-        return configs
-    
-    def _load_sample_results(self) -> Dict[str, str]:
-        """Load sample research results for demonstration."""
-        return {
-            "ai_climate_change": """
-# AI Applications in Climate Change Research: A Comprehensive Analysis
-
-## Executive Summary
-
-Artificial Intelligence (AI) has emerged as a transformative force in climate change research, offering unprecedented capabilities for data analysis, prediction modeling, and solution development. This comprehensive review examines the current applications, methodologies, and future potential of AI in addressing one of humanity's most pressing challenges.
-
-## Current Applications
-
-### 1. Climate Modeling and Prediction
-AI technologies, particularly machine learning algorithms, have revolutionized climate modeling by:
-- Processing vast datasets from satellites, weather stations, and ocean buoys
-- Identifying complex patterns in atmospheric and oceanic systems
-- Improving accuracy of long-term climate projections
-- Enabling real-time weather prediction with enhanced precision
-
-### 2. Environmental Monitoring
-Deep learning systems are now capable of:
-- Analyzing satellite imagery to track deforestation and ice sheet changes
-- Monitoring air and water quality through sensor networks
-- Detecting environmental anomalies and pollution sources
-- Tracking wildlife populations and biodiversity changes
-
-### 3. Energy Optimization
-AI-driven solutions contribute to emissions reduction through:
-- Smart grid management and renewable energy integration
-- Optimizing energy consumption in buildings and industrial processes
-- Predicting renewable energy generation patterns
-- Facilitating the transition to sustainable energy systems
-
-## Technological Approaches
-
-### Machine Learning Techniques
-- **Neural Networks**: Used for pattern recognition in climate data
-- **Ensemble Methods**: Combining multiple models for robust predictions
-- **Time Series Analysis**: Forecasting climate variables over time
-- **Computer Vision**: Processing satellite and aerial imagery
-
-### Data Sources and Integration
-- Satellite observations (temperature, precipitation, vegetation)
-- Weather station networks
-- Ocean monitoring systems
-- Historical climate records
-- Socioeconomic datasets
-
-## Research Findings and Impact
-
-Recent studies demonstrate significant improvements in:
-- Climate model accuracy (15-30% improvement in some cases)
-- Early warning system effectiveness
-- Carbon footprint tracking and reduction strategies
-- Renewable energy forecasting precision
-
-## Challenges and Limitations
-
-### Technical Challenges
-- Data quality and availability issues
-- Computational resource requirements
-- Model interpretability and uncertainty quantification
-- Integration of multi-scale processes
-
-### Ethical and Social Considerations
-- Equitable access to AI-driven climate solutions
-- Privacy concerns with environmental monitoring
-- Potential for technology dependence
-- Need for transparent and accountable AI systems
-
-## Future Directions
-
-### Emerging Technologies
-- Quantum computing for complex climate simulations
-- Edge computing for distributed environmental monitoring
-- Federated learning for collaborative research
-- Explainable AI for better scientific understanding
-
-### Research Priorities
-- Developing AI systems for climate adaptation strategies
-- Improving regional and local climate predictions
-- Creating integrated assessment models
-- Enhancing decision support systems for policymakers
-
-## Conclusion
-
-AI represents a powerful tool in the fight against climate change, offering capabilities that extend far beyond traditional research methods. While challenges remain, the integration of AI technologies in climate science continues to yield promising results and opens new avenues for understanding and addressing global environmental challenges.
-
-The success of AI in climate research depends on continued collaboration between computer scientists, climate researchers, policymakers, and communities worldwide. As these technologies mature, they will play an increasingly vital role in developing effective strategies for climate mitigation and adaptation.
-
-## References and Sources
-
-This analysis draws from recent publications in Nature Climate Change, Journal of Climate, Artificial Intelligence journals, and reports from leading climate research institutions including NOAA, NASA, and the IPCC.
-            """,
-            
-            "quantum_computing": """
-# Quantum Computing: Current State and Future Applications
-
-## Overview
-
-Quantum computing represents a paradigm shift in computational technology, leveraging quantum mechanical phenomena to perform calculations that are intractable for classical computers. This report examines the current state of quantum computing technology, its applications, and future prospects.
-
-## Technical Foundations
-
-### Quantum Principles
-- **Superposition**: Qubits can exist in multiple states simultaneously
-- **Entanglement**: Quantum particles can be correlated across vast distances
-- **Interference**: Quantum states can amplify correct answers and cancel incorrect ones
-
-### Current Technologies
-- **Superconducting Qubits**: Used by IBM, Google, and Rigetti
-- **Trapped Ions**: Employed by IonQ and Honeywell
-- **Photonic Systems**: Developed by Xanadu and PsiQuantum
-- **Neutral Atoms**: Advanced by Atom Computing and QuEra
-
-## Current Applications
-
-### Optimization Problems
-- Supply chain optimization
-- Financial portfolio management
-- Traffic flow optimization
-- Resource allocation in telecommunications
-
-### Cryptography and Security
-- Quantum key distribution
-- Post-quantum cryptography development
-- Secure communication protocols
-- Breaking classical encryption schemes
-
-### Scientific Simulation
-- Molecular modeling for drug discovery
-- Materials science research
-- Chemical reaction simulation
-- Physics research applications
-
-## Industry Developments
-
-### Major Players
-- **IBM**: Quantum Network with over 200 members
-- **Google**: Achieved quantum supremacy with Sycamore processor
-- **Microsoft**: Azure Quantum cloud platform
-- **Amazon**: Braket quantum computing service
-- **Startups**: IonQ, Rigetti, D-Wave, and others
-
-### Investment and Funding
-- Over $2.4 billion in private investment in 2021
-- Government initiatives in US, EU, China, and other countries
-- Corporate R&D spending exceeding $1 billion annually
-
-## Challenges and Limitations
-
-### Technical Challenges
-- Quantum error rates and decoherence
-- Limited qubit connectivity
-- Scalability issues
-- Error correction requirements
-
-### Practical Limitations
-- Extreme operating conditions (near absolute zero)
-- Limited gate fidelity
-- Short coherence times
-- High error rates
-
-## Future Outlook
+# Topics that get the AI/climate sample report; everything else gets the quantum one
+_CLIMATE_AI_RE = re.compile(r"\b(?:climate|ai)\b", re.IGNORECASE)
 
-### Near-term (2-5 years)
-- Improved error rates and coherence times
-- Larger quantum systems (1000+ qubits)
-- Better quantum algorithms
-- Enhanced quantum error correction
-
-### Medium-term (5-15 years)
-- Fault-tolerant quantum computers
-- Practical quantum advantage in optimization
-- Quantum machine learning applications
-- Integration with classical computing
-
-### Long-term (15+ years)
-- Universal quantum computers
-- Quantum internet infrastructure
-- Revolutionary applications in AI and simulation
-- Widespread commercial adoption
-
-## Conclusions
-
-Quantum computing is transitioning from research laboratories to practical applications. While significant challenges remain, the potential for revolutionary advances in computation, optimization, and simulation continues to drive substantial investment and research efforts worldwide.
-
-The next decade will be crucial in determining which quantum technologies achieve practical quantum advantage and begin delivering real-world value across industries.
-            """
-        }
-    
-    def display_welcome(self):
-        """Display welcome message and features."""
-        welcome_text = """
+_WELCOME_TEXT = """
 [bold blue]🔬 Open Deep Research - Feature Demo[/bold blue]
 
 Welcome to the Open Deep Research demonstration!
@@ -261,10 +54,191 @@ Welcome to the Open Deep Research demonstration!
 
 [yellow]Note: This is a demonstration version. For actual research, 
 you'll need to configure API keys and run the full system.[/yellow]
+"""
+# Markup is parsed once here rather than on every render
+_WELCOME_PANEL = Panel(Text.from_markup(_WELCOME_TEXT), title="Demo Mode", border_style="blue")
+
+# Topics offered by the research simulation; the last entry prompts for a custom topic
+_TOPIC_CHOICES = (
+    "The impact of AI on climate change research",
+    "Quantum computing applications in cryptography",
+    "Sustainable energy solutions for urban environments",
+    "Custom topic"
+)
+_TOPIC_CHOICE_STRS = tuple(str(i) for i in range(1, len(_TOPIC_CHOICES) + 1))
+_TOPIC_MENU = "\n".join(f"{i}. {topic}" for i, topic in enumerate(_TOPIC_CHOICES, 1))
+
+_MAIN_MENU = "\n".join([
+    "1. View Available Configurations",
+    "2. Detailed Configuration Analysis",
+    "3. Simulate Research Process",
+    "4. Model Comparison Demo",
+    "5. Feature Demonstration",
+    "6. Exit Demo"
+])
+_MAIN_MENU_CHOICES = ("1", "2", "3", "4", "5", "6")
+
+SAMPLES_DIR = Path("demo/samples")
+
+# Number of report characters shown before the "report continues" marker
+REPORT_PREVIEW_CHARS = 2000
+
+
+def _report_preview(report: str) -> str:
+    """Return the start of a report for display, marking where it was cut off."""
+    if len(report) > REPORT_PREVIEW_CHARS:
+        return report[:REPORT_PREVIEW_CHARS] + "\n\n[dim]... (report continues)[/dim]"
+    return report
+
+
+class _LazyDict(dict):
+    """Dict that fills in missing keys by calling loader(key) and keeping the result."""
+    
+    def __init__(self, loader: Callable[[str], Any]):
+        super().__init__()
+        self._loader = loader
+    
+    def __missing__(self, key: str) -> Any:
+        value = self[key] = self._loader(key)
+        return value
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DemoConfig:
+    """A demo configuration file, parsed once into a fixed-layout record.
+    
+    Optional fields are None when the file doesn't define them.
+    """
+    name: str
+    description: Optional[str] = None
+    use_case: Optional[str] = None
+    configuration: Optional[Dict[str, Any]] = None
+    estimated_cost: Optional[str] = None
+    estimated_time: Optional[str] = None
+    quality: Optional[str] = None
+    special_features: Optional[List[str]] = None
+    
+    @classmethod
+    def from_dict(cls, config_key: str, data: Dict[str, Any]) -> "DemoConfig":
+        """Build a record from a parsed config file, named after its key if it has no name."""
+        return cls(**{"name": config_key, **{k: v for k, v in data.items() if k in _DEMO_CONFIG_FIELDS}})
+
+
+_DEMO_CONFIG_FIELDS = frozenset(field.name for field in fields(DemoConfig))
+
+
+class MockDemo:
+    """Mock demo for Open Deep Research without API calls."""
+    
+    def __init__(self) -> None:
+        self.console: Console = Console()
+        self.demo_configs: Dict[str, DemoConfig] = self._load_demo_configs()
+        # Configs don't change during a session, so derive the table rows and menu order once
+        self._config_rows: List[Tuple[str, str, str, str, str]] = [
+            (
+                config.name,
+                config.use_case if config.use_case is not None else "General research",
+                config.estimated_cost if config.estimated_cost is not None else "Unknown",
+                config.estimated_time if config.estimated_time is not None else "Unknown",
+                config.quality if config.quality is not None else "Good"
+            )
+            for config in self.demo_configs.values()
+        ]
+        self._config_keys: Tuple[str, ...] = tuple(self.demo_configs)
+        self._config_names: Dict[str, str] = {config_key: config.name for config_key, config in self.demo_configs.items()}
+        self._config_menu: str = "\n".join(
+            f"{i}. {self._config_names[config_key]}" for i, config_key in enumerate(self._config_keys, 1)
+        )
+        self._config_choice_strs: Tuple[str, ...] = tuple(str(i) for i in range(1, len(self._config_keys) + 1))
+        # Memoized per instance so the cache is released together with the demo
+        self._render_config_syntax: Callable[[str], Syntax] = lru_cache(maxsize=None)(self._build_config_syntax)
+        self._comparison_table: Table = self._build_comparison_table()
+        # Menu option number -> handler; the exit option is deliberately absent
+        self._handlers: Dict[str, Callable[[], None]] = {
+            str(i): handler
+            for i, handler in enumerate(
+                [self._opt_view_configs, self._opt_detail, self._opt_simulate, self._opt_compare, self._opt_features],
+                1
+            )
+        }
+        # Seconds each simulated research step takes; set DEMO_STEP_SLEEP=0 to skip the wait
+        self.sleep_per_step: float = float(os.environ.get("DEMO_STEP_SLEEP", "1.0"))
+        
+    def _load_demo_configs(self) -> Dict[str, DemoConfig]:
+        """Load demo configurations from the configs directory."""
+        return {
+            config_key: DemoConfig.from_dict(config_key, data)
+            for config_key, data in self._read_demo_config_files().items()
+        }
+    
+    def _read_demo_config_files(self) -> Dict[str, Dict[str, Any]]:
+        """Read the raw demo configuration files.
+        
+        Parsed configurations are pickled to .cache.pkl in the same directory and
+        reused for as long as every file keeps its name and mtime.
         """
-        self.console.print(Panel(welcome_text, title="Demo Mode", border_style="blue"))
+        configs = {}
+        config_dir = "demo/configs"
+        
+        # DirEntry caches its stat result, so listing plus signature costs one
+        # scandir and one stat per file with no Path objects in between
+        try:
+            with os.scandir(config_dir) as it:
+                entries = [entry for entry in it if entry.is_file() and entry.name.endswith(".json")]
+        except FileNotFoundError:
+            return configs
+        
+        # Names are part of the signature: a rename keeps the mtime but changes the config key
+        signature = tuple(sorted((entry.name, entry.stat().st_mtime_ns) for entry in entries))
+        cache_file = os.path.join(config_dir, ".cache.pkl")
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            if cached["sig"] == signature:
+                return cached["configs"]
+        except Exception:
+            pass  # Missing or unreadable cache; rebuild it below
+        
+        complete = True
+        for entry in entries:
+            try:
+                with open(entry.path, 'rb') as f:
+                    configs[entry.name[:-len(".json")]] = loads(f.read())
+            except Exception as e:
+                complete = False
+                self.console.print(f"[yellow]Warning: Could not load {entry.path}: {e}[/yellow]")
+        
+        # Only cache a complete load so broken files keep being reported
+        if complete:
+            try:
+                with open(cache_file, 'wb') as f:
+                    pickle.dump({"sig": signature, "configs": configs}, f, protocol=5)
+            except OSError:
+                pass
+        
+        return configs
+    
+    @cached_property
+    def sample_results(self) -> Dict[str, str]:
+        """Sample research reports from demo/samples, each read the first time it is used."""
+        return _LazyDict(lambda key: (SAMPLES_DIR / f"{key}.md").read_text())
+    
+    @cached_property
+    def sample_previews(self) -> Dict[str, str]:
+        """Display previews of the sample reports, computed once per session."""
+        return _LazyDict(lambda key: _report_preview(self.sample_results[key]))
     
-    def display_configurations(self):
+    @cached_property
+    def sample_preview_panels(self) -> Dict[str, Panel]:
+        """Panels wrapping the sample report previews, reused on every display."""
+        return _LazyDict(lambda key: Panel(self.sample_previews[key], border_style="blue"))
+    
+    def display_welcome(self) -> None:
+        """Display welcome message and features."""
+        self.console.print(_WELCOME_PANEL)
+    
+    def display_configurations(self) -> None:
         """Display available configurations."""
         self.console.print("\n[bold]Available Research Configurations:[/bold]")
         
@@ -275,18 +249,12 @@ you'll need to configure API keys and run the full system.[/yellow]
         table.add_column("Time", style="green", min_width=12)
         table.add_column("Quality", style="white", min_width=15)
         
-        for config_key, config_data in self.demo_configs.items():
-            table.add_row(
-                config_data.get("name", config_key),
-                config_data.get("use_case", "General research"),
-                config_data.get("estimated_cost", "Unknown"),
-                config_data.get("estimated_time", "Unknown"),
-                config_data.get("quality", "Good")
-            )
+        for row in self._config_rows:
+            table.add_row(*row)
         
         self.console.print(table)
     
-    def display_configuration_details(self, config_key: str):
+    def display_configuration_details(self, config_key: str) -> None:
         """Display detailed configuration information."""
         if config_key not in self.demo_configs:
             self.console.print(f"[red]Configuration '{config_key}' not found.[/red]")
@@ -294,52 +262,55 @@ you'll need to configure API keys and run the full system.[/yellow]
         
         config = self.demo_configs[config_key]
         
-        self.console.print(f"\n[bold blue]Configuration Details: {config.get('name', config_key)}[/bold blue]")
+        renderables = [f"\n[bold blue]Configuration Details: {config.name}[/bold blue]"]
         
         # Description and use case
-        if "description" in config:
-            self.console.print(f"\n[bold]Description:[/bold] {config['description']}")
+        if config.description is not None:
+            renderables.append(f"\n[bold]Description:[/bold] {config.description}")
         
-        if "use_case" in config:
-            self.console.print(f"[bold]Use Case:[/bold] {config['use_case']}")
+        if config.use_case is not None:
+            renderables.append(f"[bold]Use Case:[/bold] {config.use_case}")
         
         # Configuration parameters
-        if "configuration" in config:
-            self.console.print(f"\n[bold]Configuration Parameters:[/bold]")
-            config_syntax = Syntax(
-                json.dumps(config["configuration"], indent=2),
-                "json",
-                theme="monokai",
-                line_numbers=True
-            )
-            self.console.print(config_syntax)
+        if config.configuration is not None:
+            renderables.append(f"\n[bold]Configuration Parameters:[/bold]")
+            renderables.append(self._render_config_syntax(config_key))
         
         # Performance estimates
         estimates = []
         for key in ["estimated_cost", "estimated_time", "quality"]:
-            if key in config:
-                estimates.append(f"{key.replace('_', ' ').title()}: {config[key]}")
+            value = getattr(config, key)
+            if value is not None:
+                estimates.append(f"{key.replace('_', ' ').title()}: {value}")
         
         if estimates:
-            self.console.print(f"\n[bold]Performance Estimates:[/bold]")
+            renderables.append(f"\n[bold]Performance Estimates:[/bold]")
             for estimate in estimates:
-                self.console.print(f"• {estimate}")
+                renderables.append(f"• {estimate}")
         
         # Special features
-        if "special_features" in config:
-            self.console.print(f"\n[bold]Special Features:[/bold]")
-            for feature in config["special_features"]:
-                self.console.print(f"• {feature}")
+        if config.special_features is not None:
+            renderables.append(f"\n[bold]Special Features:[/bold]")
+            for feature in config.special_features:
+                renderables.append(f"• {feature}")
+        
+        self.console.print(Group(*renderables))
+    
+    def _build_config_syntax(self, config_key: str) -> Syntax:
+        """Build the highlighted JSON view of a configuration's parameters."""
+        return Syntax(
+            dumps_indented(self.demo_configs[config_key].configuration).decode("utf-8"),
+            "json",
+            theme="monokai",
+            line_numbers=True
+        )
     
     def simulate_research(self, topic: str, config_key: str) -> Dict[str, Any]:
         """Simulate a research process."""
         self.console.print(f"\n[bold green]Simulating Research:[/bold green] {topic}")
-        self.console.print(f"[bold blue]Using Configuration:[/bold blue] {self.demo_configs[config_key].get('name', config_key)}")
+        self.console.print(f"[bold blue]Using Configuration:[/bold blue] {self._config_names[config_key]}")
         
         # Simulate research progress
-        import time
-        from rich.progress import Progress, SpinnerColumn, TextColumn
-        
         steps = [
             "Analyzing research topic...",
             "Searching for relevant sources...",
@@ -349,24 +320,26 @@ you'll need to configure API keys and run the full system.[/yellow]
             "Generating final report..."
         ]
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console
-        ) as progress:
-            for step in steps:
-                task = progress.add_task(step, total=None)
-                time.sleep(1)  # Simulate processing time
-                progress.remove_task(task)
+        if self.sleep_per_step > 0:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console
+            ) as progress:
+                task = progress.add_task("", total=len(steps))
+                for step in steps:
+                    progress.update(task, description=step, advance=1)
+                    time.sleep(self.sleep_per_step)  # Simulate processing time
+        else:
+            self.console.print(steps[-1])
         
         # Return mock result based on topic
-        if "climate" in topic.lower() or "ai" in topic.lower():
-            result_key = "ai_climate_change"
-        else:
-            result_key = "quantum_computing"
+        result_key = "ai_climate_change" if _CLIMATE_AI_RE.search(topic) else "quantum_computing"
         
         return {
             "final_report": self.sample_results[result_key],
+            "preview": self.sample_previews[result_key],
+            "sample_key": result_key,
             "notes": [
                 "Research conducted using simulated API calls",
                 "Sources include academic papers, reports, and technical documentation",
@@ -376,7 +349,7 @@ you'll need to configure API keys and run the full system.[/yellow]
             "simulation": True
         }
     
-    def display_research_results(self, result: Dict[str, Any], topic: str):
+    def display_research_results(self, result: Dict[str, Any], topic: str) -> None:
         """Display simulated research results."""
         self.console.print("\n" + "="*80)
         self.console.print(f"[bold green]Research Results for:[/bold green] {topic}")
@@ -386,13 +359,13 @@ you'll need to configure API keys and run the full system.[/yellow]
         if "final_report" in result:
             self.console.print("\n[bold blue]Generated Report:[/bold blue]")
             # Show first part of the report
-            report = result["final_report"]
-            if len(report) > 2000:
-                preview = report[:2000] + "\n\n[dim]... (report continues)[/dim]"
+            if "sample_key" in result:
+                panel = self.sample_preview_panels[result["sample_key"]]
             else:
-                preview = report
+                preview = result.get("preview") or _report_preview(result["final_report"])
+                panel = Panel(preview, border_style="blue")
             
-            self.console.print(Panel(preview, border_style="blue"))
+            self.console.print(panel)
         
         # Show research notes
         if "notes" in result:
@@ -406,10 +379,8 @@ you'll need to configure API keys and run the full system.[/yellow]
         if result.get("simulation"):
             self.console.print("\n[yellow]Note: This was a simulated research process for demonstration purposes.[/yellow]")
     
-    def run_comparison_demo(self):
-        """Demonstrate model comparison capabilities."""
-        self.console.print("\n[bold blue]🔬 Model Comparison Demo[/bold blue]")
-        
+    def _build_comparison_table(self) -> Table:
+        """Build the static simulated model comparison table."""
         comparison_table = Table(title="Simulated Model Performance Comparison", show_header=True, header_style="bold magenta")
         comparison_table.add_column("Model Configuration", style="cyan", min_width=20)
         comparison_table.add_column("Speed (simulated)", style="yellow", min_width=15)
@@ -428,7 +399,12 @@ you'll need to configure API keys and run the full system.[/yellow]
         for config, speed, quality, cost, best_for in comparisons:
             comparison_table.add_row(config, speed, quality, cost, best_for)
         
-        self.console.print(comparison_table)
+        return comparison_table
+    
+    def run_comparison_demo(self) -> None:
+        """Demonstrate model comparison capabilities."""
+        self.console.print("\n[bold blue]🔬 Model Comparison Demo[/bold blue]")
+        self.console.print(self._comparison_table)
         
         self.console.print("\n[bold green]Key Insights from Comparison:[/bold green]")
         insights = [
@@ -441,7 +417,7 @@ you'll need to configure API keys and run the full system.[/yellow]
         for insight in insights:
             self.console.print(f"• {insight}")
     
-    def demonstrate_features(self):
+    def demonstrate_features(self) -> None:
         """Demonstrate key features of the system."""
         features = [
             {
@@ -471,98 +447,87 @@ you'll need to configure API keys and run the full system.[/yellow]
             }
         ]
         
-        self.console.print("\n[bold blue]🚀 Key Features Demonstration[/bold blue]")
+        # Collect everything and print it as one renderable to avoid a write per line
+        renderables = ["\n[bold blue]🚀 Key Features Demonstration[/bold blue]"]
         
         for feature in features:
-            self.console.print(f"\n[bold cyan]{feature['name']}[/bold cyan]")
-            self.console.print(f"[dim]{feature['description']}[/dim]")
-            self.console.print("[bold]Benefits:[/bold]")
+            renderables.append(f"\n[bold cyan]{feature['name']}[/bold cyan]")
+            renderables.append(f"[dim]{feature['description']}[/dim]")
+            renderables.append("[bold]Benefits:[/bold]")
             for benefit in feature['benefits']:
-                self.console.print(f"  • {benefit}")
+                renderables.append(f"  • {benefit}")
+        
+        self.console.print(Group(*renderables))
+    
+    def _opt_view_configs(self) -> None:
+        """Menu option 1: list the available configurations."""
+        self.display_configurations()
+    
+    def _opt_detail(self) -> None:
+        """Menu option 2: show the details of a chosen configuration."""
+        if not self.demo_configs:
+            self.console.print("[yellow]No configurations available for analysis.[/yellow]")
+            return
+        
+        self.console.print("\nAvailable configurations:")
+        self.console.print(self._config_menu)
+        
+        config_choice = Prompt.ask("Select configuration", choices=self._config_choice_strs)
+        selected_config = self._config_keys[int(config_choice) - 1]
+        self.display_configuration_details(selected_config)
+    
+    def _opt_simulate(self) -> None:
+        """Menu option 3: simulate a research run for a chosen topic and configuration."""
+        if not self.demo_configs:
+            self.console.print("[yellow]No configurations available for simulation.[/yellow]")
+            return
+        
+        # Select topic
+        self.console.print("\nSelect a research topic:")
+        self.console.print(_TOPIC_MENU)
+        
+        topic_choice = Prompt.ask("Select topic", choices=_TOPIC_CHOICE_STRS)
+        
+        if int(topic_choice) == len(_TOPIC_CHOICES):
+            topic = Prompt.ask("Enter your custom research topic")
+        else:
+            topic = _TOPIC_CHOICES[int(topic_choice) - 1]
+        
+        # Select configuration
+        self.console.print("\nSelect configuration:")
+        self.console.print(self._config_menu)
+        
+        config_choice = Prompt.ask("Select configuration", choices=self._config_choice_strs)
+        selected_config = self._config_keys[int(config_choice) - 1]
+        
+        # Simulate research
+        result = self.simulate_research(topic, selected_config)
+        self.display_research_results(result, topic)
+    
+    def _opt_compare(self) -> None:
+        """Menu option 4: show the model comparison demo."""
+        self.run_comparison_demo()
     
-    def run_demo(self):
+    def _opt_features(self) -> None:
+        """Menu option 5: walk through the key features."""
+        self.demonstrate_features()
+    
+    def run_demo(self) -> None:
         """Run the complete demo."""
         self.display_welcome()
         
         while True:
             self.console.print("\n[bold]Demo Options:[/bold]")
-            options = [
-                "1. View Available Configurations",
-                "2. Detailed Configuration Analysis",
-                "3. Simulate Research Process",
-                "4. Model Comparison Demo",
-                "5. Feature Demonstration",
-                "6. Exit Demo"
-            ]
-            
-            for option in options:
-                self.console.print(option)
+            self.console.print(_MAIN_MENU)
             
             try:
-                choice = Prompt.ask("Select an option", choices=["1", "2", "3", "4", "5", "6"])
-                
-                if choice == "1":
-                    self.display_configurations()
-                
-                elif choice == "2":
-                    if not self.demo_configs:
-                        self.console.print("[yellow]No configurations available for analysis.[/yellow]")
-                        continue
-                    
-                    config_choices = list(self.demo_configs.keys())
-                    self.console.print("\nAvailable configurations:")
-                    for i, config in enumerate(config_choices, 1):
-                        self.console.print(f"{i}. {self.demo_configs[config].get('name', config)}")
-                    
-                    config_choice = Prompt.ask("Select configuration", choices=[str(i) for i in range(1, len(config_choices) + 1)])
-                    selected_config = config_choices[int(config_choice) - 1]
-                    self.display_configuration_details(selected_config)
+                choice = Prompt.ask("Select an option", choices=_MAIN_MENU_CHOICES)
                 
-                elif choice == "3":
-                    if not self.demo_configs:
-                        self.console.print("[yellow]No configurations available for simulation.[/yellow]")
-                        continue
-                    
-                    # Select topic
-                    topic_choices = [
-                        "The impact of AI on climate change research",
-                        "Quantum computing applications in cryptography",
-                        "Sustainable energy solutions for urban environments",
-                        "Custom topic"
-                    ]
-                    
-                    self.console.print("\nSelect a research topic:")
-                    for i, topic in enumerate(topic_choices, 1):
-                        self.console.print(f"{i}. {topic}")
-                    
-                    topic_choice = Prompt.ask("Select topic", choices=[str(i) for i in range(1, len(topic_choices) + 1)])
-                    
-                    if int(topic_choice) == len(topic_choices):
-                        topic = Prompt.ask("Enter your custom research topic")
-                    else:
-                        topic = topic_choices[int(topic_choice) - 1]
-                    
-                    # Select configuration
-                    config_choices = list(self.demo_configs.keys())
-                    self.console.print("\nSelect configuration:")
-                    for i, config in enumerate(config_choices, 1):
-                        self.console.print(f"{i}. {self.demo_configs[config].get('name', config)}")
-                    
-                    config_choice = Prompt.ask("Select configuration", choices=[str(i) for i in range(1, len(config_choices) + 1)])
-                    selected_config = config_choices[int(config_choice) - 1]
-                    
-                    # Simulate research
-                    result = self.simulate_research(topic, selected_config)
-                    self.display_research_results(result, topic)
-                
-                elif choice == "4":
-                    self.run_comparison_demo()
-                
-                elif choice == "5":
-                    self.demonstrate_features()
-                
-                elif choice == "6":
+                # Option 6 (exit) has no handler
+                handler = self._handlers.get(choice)
+                if handler is None:
                     break
+                handler()
                 
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Demo interrupted by user.[/yellow]")
@@ -574,8 +539,7 @@ you'll need to configure API keys and run the full system.[/yellow]
         self.console.print("\n[bold blue]Thank you for exploring Open Deep Research![/bold blue]")
         self.console.print("To run actual research, configure your API keys and use the full system.")
 
-
-def main():
+def main() -> None:
     """Main entry point for the demo."""
     demo = MockDemo()
     demo.run_demo()
@@ -6,11 +6,15 @@ This demo showcases the evaluation framework for research quality assessment
 and comparison capabilities.
 """
 
+import asyncio
+import bisect
+import os
 import sys
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -22,23 +26,83 @@ import random
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+from async_prompts import ask, confirm
+from json_io import dumps_indented
 
-class EvaluationDemo:
-    """Evaluation demo for Open Deep Research."""
-    
-    def __init__(self):
-        self.console = Console()
-        self.sample_reports = self._generate_sample_reports()
-        
-    def _generate_sample_reports(self) -> List[Dict[str, Any]]:
-        """Generate sample research reports for evaluation."""
-        return [
-            {
-                "id": "report_1",
-                "topic": "AI in Climate Change Research",
-                "model": "openai:gpt-4o",
-                "search_api": "tavily",
-                "final_report": """
+
+# Ranges the simulated structure, accuracy and clarity scores are drawn from
+_SIMULATED_SCORE_RANGES = ((0.7, 0.95), (0.75, 0.92), (0.8, 0.95))
+
+# Column schemas for the demo's tables: (header, add_column keyword arguments)
+_SAMPLE_TABLE_SCHEMA = (
+    ("ID", {"style": "dim", "width": 12}),
+    ("Topic", {"min_width": 20}),
+    ("Model", {"min_width": 20}),
+    ("Search API", {"min_width": 15}),
+    ("Sources", {"justify": "right"}),
+    ("Time (s)", {"justify": "right"}),
+)
+_EVAL_TABLE_SCHEMA = (
+    ("Report", {"min_width": 12}),
+    ("Model", {"min_width": 20}),
+    ("Overall", {"justify": "right"}),
+    ("Comprehensive", {"justify": "right"}),
+    ("Sources", {"justify": "right"}),
+    ("Structure", {"justify": "right"}),
+    ("Accuracy", {"justify": "right"}),
+    ("Clarity", {"justify": "right"}),
+)
+# Evaluation keys shown in the score columns of _EVAL_TABLE_SCHEMA, in column order
+_EVAL_SCORE_KEYS = ("overall_score", "comprehensiveness", "source_diversity", "structure_quality", "accuracy", "clarity")
+_PERFORMANCE_TABLE_SCHEMA = (
+    ("Model", {"min_width": 25}),
+    ("Avg Score", {"justify": "right"}),
+    ("Reports", {"justify": "right"}),
+    ("Recommendation", {"min_width": 20}),
+)
+
+
+@cache
+def _deterministic_metrics(report_length: int, sources_count: int) -> Tuple[float, float]:
+    """Return the (comprehensiveness, source_diversity) metrics, which depend only on the report's shape."""
+    return min(1.0, report_length / 1000), min(1.0, sources_count / 20)
+
+
+def _make_table(schema: Tuple[Tuple[str, Dict[str, Any]], ...]) -> Table:
+    """Build an empty table with the demo's header style from a column schema."""
+    table = Table(show_header=True, header_style="bold magenta")
+    for header, column_kwargs in schema:
+        table.add_column(header, **column_kwargs)
+    return table
+
+
+# Judge model and polling interval used when evaluations go through the OpenAI Batch API
+BATCH_JUDGE_MODEL = "gpt-4.1"
+BATCH_POLL_INTERVAL = 30
+
+# Average-score thresholds and the recommendation for each band they delimit (scores
+# equal to a threshold fall in the lower band)
+_RECOMMENDATION_THRESHOLDS = (0.75, 0.85)
+_RECOMMENDATIONS = ("Needs Improvement", "Good", "Excellent")
+
+_JUDGE_PROMPT = """You are grading a research report. Score it on three criteria, each a number between 0 and 1:
+- structure_quality: logical organization, headings and flow
+- accuracy: factual correctness of the claims
+- clarity: how easy the report is to read and understand
+
+Respond with a JSON object with exactly the keys "structure_quality", "accuracy" and "clarity"."""
+
+# Sample reports are immutable content shared by every demo instance; each gets its
+# report length precomputed so evaluations don't recompute it
+_SAMPLE_REPORTS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType({**report, "report_length": len(report["final_report"])})
+    for report in [
+        {
+            "id": "report_1",
+            "topic": "AI in Climate Change Research",
+            "model": "openai:gpt-4o",
+            "search_api": "tavily",
+            "final_report": """
 # AI in Climate Change Research
 
 ## Executive Summary
@@ -61,16 +125,16 @@ Current AI applications include:
 1. Increase investment in AI climate research
 2. Develop standardized AI climate datasets
 3. Foster international AI collaboration
-                """,
-                "sources_count": 15,
-                "research_time": 45.2
-            },
-            {
-                "id": "report_2", 
-                "topic": "AI in Climate Change Research",
-                "model": "anthropic:claude-3-5-sonnet-20241022",
-                "search_api": "anthropic_web_search",
-                "final_report": """
+            """,
+            "sources_count": 15,
+            "research_time": 45.2
+        },
+        {
+            "id": "report_2", 
+            "topic": "AI in Climate Change Research",
+            "model": "anthropic:claude-3-5-sonnet-20241022",
+            "search_api": "anthropic_web_search",
+            "final_report": """
 # Artificial Intelligence Applications in Climate Science
 
 ## Overview
@@ -92,16 +156,16 @@ The integration of AI in climate research encompasses:
 
 ## Strategic Implications
 Organizations should prioritize AI development for climate applications.
-                """,
-                "sources_count": 12,
-                "research_time": 38.7
-            },
-            {
-                "id": "report_3",
-                "topic": "Quantum Computing Applications", 
-                "model": "openai:gpt-4o-mini",
-                "search_api": "tavily",
-                "final_report": """
+            """,
+            "sources_count": 12,
+            "research_time": 38.7
+        },
+        {
+            "id": "report_3",
+            "topic": "Quantum Computing Applications", 
+            "model": "openai:gpt-4o-mini",
+            "search_api": "tavily",
+            "final_report": """
 # Quantum Computing Applications
 
 ## Summary
@@ -117,12 +181,29 @@ Quantum computing shows promise in cryptography, optimization, and simulation.
 2. Drug discovery
 3. Financial modeling
 4. Traffic optimization
-                """,
-                "sources_count": 8,
-                "research_time": 22.1
-            }
-        ]
+            """,
+            "sources_count": 8,
+            "research_time": 22.1
+        }
+    ]
+)
+
+
+class EvaluationDemo:
+    """Evaluation demo for Open Deep Research."""
     
+    # Source of the simulated judge scores
+    _rng = random.Random()
+    
+    def __init__(self, max_concurrent_evals: int = 3, batch_mode: bool = False):
+        self.console = Console()
+        self.sample_reports = _SAMPLE_REPORTS
+        # Send all judge calls as one OpenAI Batch API job instead of simulating them
+        self.batch_mode = batch_mode
+        # Caps simultaneous judge calls so a real evaluator stays within provider rate limits
+        self.max_concurrent_evals = max_concurrent_evals
+        self._eval_semaphore = asyncio.Semaphore(max_concurrent_evals)
+        
     def display_welcome(self):
         """Display welcome message for evaluation demo."""
         welcome_text = """
@@ -148,13 +229,7 @@ This demo showcases the research evaluation framework:
         """Display available sample reports."""
         self.console.print("\n[bold]Sample Research Reports:[/bold]")
         
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("ID", style="dim", width=12)
-        table.add_column("Topic", min_width=20)
-        table.add_column("Model", min_width=20)
-        table.add_column("Search API", min_width=15)
-        table.add_column("Sources", justify="right")
-        table.add_column("Time (s)", justify="right")
+        table = _make_table(_SAMPLE_TABLE_SCHEMA)
         
         for report in self.sample_reports:
             table.add_row(
@@ -168,27 +243,42 @@ This demo showcases the research evaluation framework:
         
         self.console.print(table)
     
-    def evaluate_report_quality(self, report: Dict[str, Any]) -> Dict[str, float]:
-        """Evaluate the quality of a research report."""
-        # Simulate evaluation process
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console
-        ) as progress:
-            task = progress.add_task("Evaluating report quality...", total=None)
-            time.sleep(2)  # Simulate processing
+    async def evaluate_report_quality(self, report: Dict[str, Any], interactive: bool = True) -> Dict[str, float]:
+        """Evaluate the quality of a research report.
         
-        # Generate mock evaluation scores
-        report_length = len(report["final_report"])
-        sources = report["sources_count"]
+        The simulated judge delay only runs when interactive is True.
+        """
+        # Simulate evaluation process
+        if interactive:
+            async with self._eval_semaphore:
+                await asyncio.sleep(2)  # Simulate processing
         
         # Quality metrics (simulated)
-        comprehensiveness = min(1.0, report_length / 1000)
-        source_diversity = min(1.0, sources / 20)
-        structure_quality = random.uniform(0.7, 0.95)
-        accuracy_score = random.uniform(0.75, 0.92)
-        clarity_score = random.uniform(0.8, 0.95)
+        return self._build_scores(report, *self._draw_simulated_scores(1)[0])
+    
+    def _draw_simulated_scores(self, count: int) -> List[Tuple[float, float, float]]:
+        """Draw simulated (structure, accuracy, clarity) judge scores for count reports."""
+        uniform = self._rng.uniform
+        (s_lo, s_hi), (a_lo, a_hi), (c_lo, c_hi) = _SIMULATED_SCORE_RANGES
+        return [(uniform(s_lo, s_hi), uniform(a_lo, a_hi), uniform(c_lo, c_hi)) for _ in range(count)]
+    
+    def _simulate_scores_for(self, reports: List[Dict[str, Any]]) -> List[Dict[str, float]]:
+        """Score reports with simulated judge scores and no simulated delay."""
+        return [
+            self._build_scores(report, *scores)
+            for report, scores in zip(reports, self._draw_simulated_scores(len(reports)))
+        ]
+    
+    def _build_scores(
+        self,
+        report: Dict[str, Any],
+        structure_quality: float,
+        accuracy_score: float,
+        clarity_score: float
+    ) -> Dict[str, float]:
+        """Combine judged scores with the metrics derived from the report itself."""
+        report_length = report.get("report_length") or len(report["final_report"])
+        comprehensiveness, source_diversity = _deterministic_metrics(report_length, report["sources_count"])
         
         return {
             "comprehensiveness": comprehensiveness,
@@ -199,43 +289,156 @@ This demo showcases the research evaluation framework:
             "overall_score": (comprehensiveness + source_diversity + structure_quality + accuracy_score + clarity_score) / 5
         }
     
-    def compare_reports(self, reports: List[Dict[str, Any]]):
+    async def evaluate_reports(self, reports: List[Dict[str, Any]], interactive: bool = True) -> List[Dict[str, float]]:
+        """Evaluate several reports concurrently behind a single progress spinner.
+        
+        Results are returned in the same order as reports. Non-interactive runs
+        skip the spinner and the simulated judge delay.
+        """
+        if self.batch_mode:
+            if os.getenv("OPENAI_API_KEY"):
+                return await self._evaluate_reports_batch(reports, interactive=interactive)
+            self.console.print("[yellow]OPENAI_API_KEY is not set; using simulated evaluation.[/yellow]")
+        
+        if not interactive:
+            return self._simulate_scores_for(reports)
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console
+        ) as progress:
+            progress.add_task("Evaluating report quality...", total=None)
+            return await asyncio.gather(*(self.evaluate_report_quality(report) for report in reports))
+    
+    async def _evaluate_reports_batch(self, reports: List[Dict[str, Any]], interactive: bool = True) -> List[Dict[str, float]]:
+        """Score reports with a single OpenAI Batch API job.
+        
+        Reports the batch has no usable output for fall back to simulated scores,
+        drawn in one pass without the simulated judge delay.
+        """
+        from openai import AsyncOpenAI
+        
+        async with AsyncOpenAI() as client:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console,
+                disable=not interactive
+            ) as progress:
+                task = progress.add_task("Submitting evaluation batch...", total=None)
+                batch_id = await self._submit_batch(client, reports)
+                progress.update(task, description=f"Waiting for evaluation batch {batch_id}...")
+                judged = await self._poll_batch(client, batch_id)
+        
+        missing = [report for report in reports if report["id"] not in judged]
+        for report in missing:
+            self.console.print(f"[yellow]No batch result for {report['id']}; using simulated scores.[/yellow]")
+        fallback = iter(self._simulate_scores_for(missing))
+        
+        evaluations = []
+        for report in reports:
+            scores = judged.get(report["id"])
+            if scores is None:
+                evaluations.append(next(fallback))
+            else:
+                evaluations.append(self._build_scores(
+                    report,
+                    structure_quality=scores["structure_quality"],
+                    accuracy_score=scores["accuracy"],
+                    clarity_score=scores["clarity"]
+                ))
+        return evaluations
+    
+    async def _submit_batch(self, client: Any, reports: List[Dict[str, Any]]) -> str:
+        """Upload one judge request per report as a JSONL batch and return the batch id."""
+        lines = [
+            json.dumps({
+                "custom_id": report["id"],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": BATCH_JUDGE_MODEL,
+                    "response_format": {"type": "json_object"},
+                    "messages": [
+                        {"role": "system", "content": _JUDGE_PROMPT},
+                        {"role": "user", "content": f"Topic: {report['topic']}\n\nReport:\n{report['final_report']}"}
+                    ]
+                }
+            })
+            for report in reports
+        ]
+        batch_file = await client.files.create(
+            file=("evaluation_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+    
+    async def _poll_batch(self, client: Any, batch_id: str) -> Dict[str, Dict[str, float]]:
+        """Wait for a batch to finish and return the parsed judge scores keyed by report id."""
+        while True:
+            batch = await client.batches.retrieve(batch_id)
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Evaluation batch {batch_id} ended with status '{batch.status}'")
+            if batch.status == "completed":
+                break
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+        
+        if not batch.output_file_id:
+            return {}
+        
+        output = await client.files.content(batch.output_file_id)
+        judged = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                content = record["response"]["body"]["choices"][0]["message"]["content"]
+                scores = json.loads(content)
+                judged[record["custom_id"]] = {
+                    key: min(1.0, max(0.0, float(scores[key])))
+                    for key in ("structure_quality", "accuracy", "clarity")
+                }
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue  # Malformed or errored response; the caller falls back for this report
+        return judged
+    
+    async def _evaluate_with_metadata(self, reports: List[Dict[str, Any]], interactive: bool = True) -> List[Dict[str, Any]]:
+        """Evaluate reports and tag each result with the report's id, model and search API."""
+        evaluations = await self.evaluate_reports(reports, interactive=interactive)
+        for report, evaluation in zip(reports, evaluations):
+            evaluation.update({
+                "report_id": report["id"],
+                "model": report["model"],
+                "search_api": report["search_api"]
+            })
+        return evaluations
+    
+    async def compare_reports(self, reports: List[Dict[str, Any]]):
         """Compare multiple research reports."""
         self.console.print("\n[bold blue]Report Comparison Analysis[/bold blue]")
         
-        # Evaluate each report
-        evaluations = []
+        # Evaluate all reports concurrently
         for report in reports:
             self.console.print(f"\nEvaluating: {report['id']} ({report['model']})")
-            evaluation = self.evaluate_report_quality(report)
-            evaluation["report_id"] = report["id"]
-            evaluation["model"] = report["model"]
-            evaluation["search_api"] = report["search_api"]
-            evaluations.append(evaluation)
+        evaluations = await self._evaluate_with_metadata(reports)
         
         # Display comparison table
         self.console.print("\n[bold]Evaluation Results:[/bold]")
         
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Report", min_width=12)
-        table.add_column("Model", min_width=20)
-        table.add_column("Overall", justify="right")
-        table.add_column("Comprehensive", justify="right")
-        table.add_column("Sources", justify="right")
-        table.add_column("Structure", justify="right")
-        table.add_column("Accuracy", justify="right")
-        table.add_column("Clarity", justify="right")
+        table = _make_table(_EVAL_TABLE_SCHEMA)
         
         for eval_result in evaluations:
             table.add_row(
                 eval_result["report_id"],
                 eval_result["model"].split(":")[-1],
-                f"{eval_result['overall_score']:.3f}",
-                f"{eval_result['comprehensiveness']:.3f}",
-                f"{eval_result['source_diversity']:.3f}",
-                f"{eval_result['structure_quality']:.3f}",
-                f"{eval_result['accuracy']:.3f}",
-                f"{eval_result['clarity']:.3f}"
+                *(f"{eval_result[key]:.3f}" for key in _EVAL_SCORE_KEYS)
             )
         
         self.console.print(table)
@@ -251,35 +454,30 @@ This demo showcases the research evaluation framework:
         """Analyze performance by model type."""
         self.console.print("\n[bold blue]Model Performance Analysis[/bold blue]")
         
-        # Group by model
-        model_scores = {}
+        # Sum and count scores per model in one pass
+        model_totals: Dict[str, List[float]] = {}
         for eval_result in evaluations:
-            model = eval_result["model"]
-            if model not in model_scores:
-                model_scores[model] = []
-            model_scores[model].append(eval_result["overall_score"])
+            totals = model_totals.setdefault(eval_result["model"], [0.0, 0])
+            totals[0] += eval_result["overall_score"]
+            totals[1] += 1
         
         # Calculate averages
-        performance_table = Table(show_header=True, header_style="bold magenta")
-        performance_table.add_column("Model", min_width=25)
-        performance_table.add_column("Avg Score", justify="right")
-        performance_table.add_column("Reports", justify="right")
-        performance_table.add_column("Recommendation", min_width=20)
-        
-        for model, scores in model_scores.items():
-            avg_score = sum(scores) / len(scores)
-            recommendation = "Excellent" if avg_score > 0.85 else "Good" if avg_score > 0.75 else "Needs Improvement"
+        performance_table = _make_table(_PERFORMANCE_TABLE_SCHEMA)
+        
+        for model, (total, count) in model_totals.items():
+            avg_score = total / count
+            recommendation = _RECOMMENDATIONS[bisect.bisect_left(_RECOMMENDATION_THRESHOLDS, avg_score)]
             
             performance_table.add_row(
                 model,
                 f"{avg_score:.3f}",
-                str(len(scores)),
+                str(count),
                 recommendation
             )
         
         self.console.print(performance_table)
     
-    def export_evaluation_results(self, evaluations: List[Dict[str, Any]]):
+    async def export_evaluation_results(self, evaluations: List[Dict[str, Any]]):
         """Export evaluation results to a file."""
         results_dir = Path("demo_results")
         results_dir.mkdir(exist_ok=True)
@@ -296,8 +494,8 @@ This demo showcases the research evaluation framework:
             "detailed_results": evaluations
         }
         
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        # Write off the event loop so slow or network storage doesn't stall the demo
+        await asyncio.to_thread(filename.write_bytes, dumps_indented(export_data))
         
         self.console.print(f"\n[green]✓[/green] Evaluation results exported to: {filename}")
     
@@ -315,16 +513,16 @@ This demo showcases the research evaluation framework:
                 self.console.print("5. Export Results")
                 self.console.print("6. Exit Demo")
                 
-                choice = Prompt.ask("Select an option", choices=["1", "2", "3", "4", "5", "6"])
+                choice = await ask("Select an option", choices=["1", "2", "3", "4", "5", "6"], console=self.console)
                 
                 if choice == "1":
                     self.show_sample_reports()
                 
                 elif choice == "2":
                     self.show_sample_reports()
-                    report_id = Prompt.ask("Select report ID to evaluate", choices=[r["id"] for r in self.sample_reports])
+                    report_id = await ask("Select report ID to evaluate", choices=[r["id"] for r in self.sample_reports], console=self.console)
                     report = next(r for r in self.sample_reports if r["id"] == report_id)
-                    evaluation = self.evaluate_report_quality(report)
+                    evaluation = (await self.evaluate_reports([report]))[0]
                     
                     self.console.print(f"\n[bold]Evaluation Results for {report_id}:[/bold]")
                     for metric, score in evaluation.items():
@@ -334,39 +532,23 @@ This demo showcases the research evaluation framework:
                     # Compare reports on same topic
                     topic_reports = [r for r in self.sample_reports if r["topic"] == "AI in Climate Change Research"]
                     if len(topic_reports) >= 2:
-                        evaluations = self.compare_reports(topic_reports)
+                        evaluations = await self.compare_reports(topic_reports)
                         self.analyze_model_performance(evaluations)
                     else:
                         self.console.print("[yellow]Not enough reports for comparison[/yellow]")
                 
                 elif choice == "4":
                     # Analyze all reports
-                    all_evaluations = []
-                    for report in self.sample_reports:
-                        eval_result = self.evaluate_report_quality(report)
-                        eval_result.update({
-                            "report_id": report["id"],
-                            "model": report["model"],
-                            "search_api": report["search_api"]
-                        })
-                        all_evaluations.append(eval_result)
+                    all_evaluations = await self._evaluate_with_metadata(self.sample_reports, interactive=False)
                     
                     self.analyze_model_performance(all_evaluations)
                 
                 elif choice == "5":
                     # Generate and export results
-                    all_evaluations = []
                     self.console.print("\n[bold]Generating comprehensive evaluation...[/bold]")
-                    for report in self.sample_reports:
-                        eval_result = self.evaluate_report_quality(report)
-                        eval_result.update({
-                            "report_id": report["id"],
-                            "model": report["model"],
-                            "search_api": report["search_api"]
-                        })
-                        all_evaluations.append(eval_result)
+                    all_evaluations = await self._evaluate_with_metadata(self.sample_reports, interactive=False)
                     
-                    self.export_evaluation_results(all_evaluations)
+                    await self.export_evaluation_results(all_evaluations)
                 
                 elif choice == "6":
                     break
@@ -376,7 +558,7 @@ This demo showcases the research evaluation framework:
                 break
             except Exception as e:
                 self.console.print(f"[bold red]Unexpected error:[/bold red] {str(e)}")
-                if not Confirm.ask("Would you like to continue?", default=True):
+                if not await confirm("Would you like to continue?", default=True, console=self.console):
                     break
         
         self.console.print("\n[bold blue]Thank you for exploring the Open Deep Research Evaluation Framework![/bold blue]")
@@ -384,10 +566,9 @@ This demo showcases the research evaluation framework:
 
 async def main():
     """Main entry point for the evaluation demo."""
-    demo = EvaluationDemo()
+    demo = EvaluationDemo(batch_mode=os.getenv("EVAL_BATCH_MODE", "").lower() in ("1", "true", "yes"))
     await demo.run_demo()
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Filename helpers shared by the demos.
+
+Topics and configuration names become parts of result filenames. Letters and
+digits from any script are kept, so non-English topics still produce
+readable names.
+"""
+
+from typing import Optional
+
+
+class _FilenameCharTable(dict):
+    """str.translate table that keeps alphanumerics, spaces, '-' and '_' and drops the rest.
+    
+    Each code point is classified the first time it is seen and then served from the dict.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        value = self[codepoint] = char if char.isalnum() or char in " -_" else None
+        return value
+
+
+_FILENAME_CHARS = _FilenameCharTable()
+
+
+def safe_filename(text: str, max_length: int) -> str:
+    """Return text reduced to filename-safe characters, with spaces as underscores, truncated."""
+    return text.translate(_FILENAME_CHARS).rstrip().replace(" ", "_")[:max_length]
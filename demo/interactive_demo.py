@@ -7,28 +7,45 @@ including different model providers, search APIs, and research workflows.
 """
 
 import asyncio
+import importlib.util
 import os
+import re
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Awaitable, Dict, Any, Iterable, Iterator, List, Optional, TypeVar
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
 from rich.table import Table
+from rich.markup import escape
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.syntax import Syntax
-import json
-import time
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-# Try to import the actual modules, fallback to mock if not available
+from async_prompts import ask, confirm
+from connection_pool import PooledTavilyConnections
+from filenames import safe_filename
+
+# Third-party packages the research graph imports at module level
+_RESEARCH_DEPENDENCIES = (
+    "aiohttp",
+    "langchain",
+    "langchain_core",
+    "langchain_mcp_adapters",
+    "langgraph",
+    "mcp",
+    "tavily"
+)
+
+# Try to import the actual modules, fallback to mock if not available. The research
+# graph itself pulls in LangGraph and every provider SDK, so availability is checked
+# with find_spec and the graph is only imported when the first research run starts;
+# the demo still drops to mock mode if that import fails.
 try:
-    from open_deep_research.deep_researcher import deep_researcher
     from open_deep_research.configuration import Configuration, SearchAPI
-    FULL_SYSTEM_AVAILABLE = True
+    FULL_SYSTEM_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in _RESEARCH_DEPENDENCIES)
 except ImportError as e:
     FULL_SYSTEM_AVAILABLE = False
     # Define mock enums and classes for demo purposes
@@ -43,76 +60,179 @@ except ImportError as e:
             self.__dict__.update(kwargs)
 
 
+# Simulated research steps that may run at the same time when a configuration sets no limit
+MOCK_STEP_CONCURRENCY = 4
+
+T = TypeVar("T")
+
+
+async def gather_bounded(aws: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    """Await aws concurrently with at most limit running at once, returning results in order."""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def bounded(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(*(bounded(aw) for aw in aws))
+
+
+@lru_cache(maxsize=128)
+def _mock_report(topic: str, search_api: str, research_model: str) -> str:
+    """Render the mock research report; repeat runs on the same topic and configuration reuse it."""
+    return f"""# Research Report: {topic}
+
+## Executive Summary
+This research report provides a comprehensive analysis of {topic}, examining current trends, key developments, and future implications.
+
+## Key Findings
+1. **Current State**: The field of {topic} is experiencing significant growth and innovation.
+2. **Major Trends**: Several important trends are shaping the landscape of {topic}.
+3. **Challenges**: Key challenges include technological hurdles and market adoption.
+
+## Detailed Analysis
+### Background
+{topic} represents an important area of study with significant implications for various stakeholders.
+
+### Methodology
+This research utilized {search_api} for information gathering and {research_model} for analysis.
+
+### Results
+Our analysis reveals that {topic} is characterized by:
+- Rapid technological advancement
+- Increasing market interest
+- Growing research community
+- Emerging practical applications
+
+## Recommendations
+1. Continue monitoring developments in {topic}
+2. Invest in research and development
+3. Consider strategic partnerships
+4. Prepare for market opportunities
+
+## Conclusion
+{topic} represents a dynamic and evolving field with significant potential for future growth and impact.
+
+---
+*This report was generated using Open Deep Research in demo mode.*
+"""
+
+
+# Splits a markdown report before each "## " heading, keeping the heading with its section
+_REPORT_SECTION_RE = re.compile(r"^(?=## )", re.MULTILINE)
+
+# Environment variables the full system cannot run without
+_REQUIRED_ENV_VARS = ("OPENAI_API_KEY", "TAVILY_API_KEY")
+
+# Predefined demo configurations, shared by every demo instance
+_DEMO_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "fast_research": {
+        "name": "Fast Research (GPT-4o-mini + Tavily)",
+        "config": {
+            "research_model": "openai:gpt-4o-mini",
+            "final_report_model": "openai:gpt-4o-mini",
+            "compression_model": "openai:gpt-4o-mini",
+            "summarization_model": "openai:gpt-4o-mini",
+            "search_api": SearchAPI.TAVILY,
+            "max_researcher_iterations": 2,
+            "max_concurrent_research_units": 3
+        }
+    },
+    "comprehensive_research": {
+        "name": "Comprehensive Research (GPT-4o + Tavily)",
+        "config": {
+            "research_model": "openai:gpt-4o",
+            "final_report_model": "openai:gpt-4o",
+            "compression_model": "openai:gpt-4o-mini",
+            "summarization_model": "openai:gpt-4o-mini",
+            "search_api": SearchAPI.TAVILY,
+            "max_researcher_iterations": 3,
+            "max_concurrent_research_units": 5
+        }
+    },
+    "anthropic_research": {
+        "name": "Anthropic Research (Claude + Native Search)",
+        "config": {
+            "research_model": "anthropic:claude-3-5-sonnet-20241022",
+            "final_report_model": "anthropic:claude-3-5-sonnet-20241022",
+            "compression_model": "anthropic:claude-3-5-haiku-20241022",
+            "summarization_model": "anthropic:claude-3-5-haiku-20241022",
+            "search_api": SearchAPI.ANTHROPIC,
+            "max_researcher_iterations": 3,
+            "max_concurrent_research_units": 4
+        }
+    },
+    "mixed_providers": {
+        "name": "Mixed Providers (GPT-4o + Claude + Tavily)",
+        "config": {
+            "research_model": "openai:gpt-4o",
+            "final_report_model": "anthropic:claude-3-5-sonnet-20241022",
+            "compression_model": "anthropic:claude-3-5-haiku-20241022",
+            "summarization_model": "openai:gpt-4o-mini",
+            "search_api": SearchAPI.TAVILY,
+            "max_researcher_iterations": 3,
+            "max_concurrent_research_units": 5
+        }
+    }
+}
+
+# Validate each configuration and build its menu description once per process
+for _config_info in _DEMO_CONFIGS.values():
+    _search_api = _config_info["config"].get("search_api", "N/A")
+    _config_info["_description"] = (
+        f"Models: {_config_info['config'].get('research_model', 'N/A')}"
+        f" | Search: {getattr(_search_api, 'value', _search_api)}"
+    )
+    _config_info["configuration"] = Configuration(**_config_info["config"])
+    if FULL_SYSTEM_AVAILABLE:
+        _config_info["configurable"] = _config_info["configuration"].model_dump()
+del _config_info, _search_api
+
+
 class InteractiveDemo:
     """Interactive demo for Open Deep Research."""
     
     def __init__(self):
         self.console = Console()
-        self.demo_configs = self._load_demo_configs()
-        
-    def _load_demo_configs(self) -> Dict[str, Dict[str, Any]]:
-        """Load predefined demo configurations."""
-        return {
-            "fast_research": {
-                "name": "Fast Research (GPT-4o-mini + Tavily)",
-                "config": {
-                    "research_model": "openai:gpt-4o-mini",
-                    "final_report_model": "openai:gpt-4o-mini",
-                    "compression_model": "openai:gpt-4o-mini",
-                    "summarization_model": "openai:gpt-4o-mini",
-                    "search_api": SearchAPI.TAVILY,
-                    "max_researcher_iterations": 2,
-                    "max_concurrent_research_units": 3
-                }
-            },
-            "comprehensive_research": {
-                "name": "Comprehensive Research (GPT-4o + Tavily)",
-                "config": {
-                    "research_model": "openai:gpt-4o",
-                    "final_report_model": "openai:gpt-4o",
-                    "compression_model": "openai:gpt-4o-mini",
-                    "summarization_model": "openai:gpt-4o-mini",
-                    "search_api": SearchAPI.TAVILY,
-                    "max_researcher_iterations": 3,
-                    "max_concurrent_research_units": 5
-                }
-            },
-            "anthropic_research": {
-                "name": "Anthropic Research (Claude + Native Search)",
-                "config": {
-                    "research_model": "anthropic:claude-3-5-sonnet-20241022",
-                    "final_report_model": "anthropic:claude-3-5-sonnet-20241022",
-                    "compression_model": "anthropic:claude-3-5-haiku-20241022",
-                    "summarization_model": "anthropic:claude-3-5-haiku-20241022",
-                    "search_api": SearchAPI.ANTHROPIC,
-                    "max_researcher_iterations": 3,
-                    "max_concurrent_research_units": 4
-                }
-            },
-            "mixed_providers": {
-                "name": "Mixed Providers (GPT-4o + Claude + Tavily)",
-                "config": {
-                    "research_model": "openai:gpt-4o",
-                    "final_report_model": "anthropic:claude-3-5-sonnet-20241022",
-                    "compression_model": "anthropic:claude-3-5-haiku-20241022",
-                    "summarization_model": "openai:gpt-4o-mini",
-                    "search_api": SearchAPI.TAVILY,
-                    "max_researcher_iterations": 3,
-                    "max_concurrent_research_units": 5
-                }
-            }
-        }
+        self.demo_configs = _DEMO_CONFIGS
+        self.connections = PooledTavilyConnections()
+        # Cleared if the research graph turns out not to be importable
+        self.full_system = FULL_SYSTEM_AVAILABLE
+        # One progress display for the session, created on the first research run
+        # and started only while a run is active
+        self._progress = None
+    
+    @contextmanager
+    def _progress_task(self, description: str, total: Optional[float] = None) -> Iterator[int]:
+        """Show the session progress display with a single task for the duration of the block."""
+        if self._progress is None:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            
+            self._progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console
+            )
+        
+        self._progress.start()
+        task = self._progress.add_task(description, total=total)
+        try:
+            yield task
+        finally:
+            # Stopping first leaves the task's final state on screen before it is cleared for the next run
+            self._progress.stop()
+            self._progress.remove_task(task)
     
     def display_welcome(self):
         """Display welcome message and features."""
-        mode = "Demo Mode (Mock)" if not FULL_SYSTEM_AVAILABLE else "Full System"
+        mode = "Demo Mode (Mock)" if not self.full_system else "Full System"
         
         welcome_text = f"""
 [bold blue]🔬 Open Deep Research - Interactive Demo[/bold blue]
 
 Welcome to the comprehensive demo of Open Deep Research!
 
-[bold {"yellow" if not FULL_SYSTEM_AVAILABLE else "green"}]Current Mode: {mode}[/bold {"yellow" if not FULL_SYSTEM_AVAILABLE else "green"}]
+[bold {"yellow" if not self.full_system else "green"}]Current Mode: {mode}[/bold {"yellow" if not self.full_system else "green"}]
 
 [bold green]Features demonstrated:[/bold green]
 • Multi-model support (OpenAI, Anthropic, Google)
@@ -122,21 +242,20 @@ Welcome to the comprehensive demo of Open Deep Research!
 • Comprehensive report generation
 
 [bold yellow]Prerequisites:[/bold yellow]
-{f"• Demo mode: No API keys required" if not FULL_SYSTEM_AVAILABLE else "• API keys configured in .env file"}
-{f"• Mock research with sample outputs" if not FULL_SYSTEM_AVAILABLE else "• Internet connection for search APIs"}
+{f"• Demo mode: No API keys required" if not self.full_system else "• API keys configured in .env file"}
+{f"• Mock research with sample outputs" if not self.full_system else "• Internet connection for search APIs"}
         """
         self.console.print(Panel(welcome_text, title="Welcome", border_style="blue"))
     
     def check_environment(self) -> bool:
         """Check if required environment variables are set."""
-        if not FULL_SYSTEM_AVAILABLE:
+        if not self.full_system:
             self.console.print("[yellow]Demo Mode:[/yellow] Running with mock functionality - no API keys required!")
             return True
             
-        required_vars = ["OPENAI_API_KEY", "TAVILY_API_KEY"]
         optional_vars = ["ANTHROPIC_API_KEY", "GOOGLE_API_KEY"]
         
-        missing_required = [var for var in required_vars if not os.getenv(var)]
+        missing_required = [var for var in _REQUIRED_ENV_VARS if not os.getenv(var)]
         missing_optional = [var for var in optional_vars if not os.getenv(var)]
         
         if missing_required:
@@ -151,8 +270,21 @@ Welcome to the comprehensive demo of Open Deep Research!
         self.console.print("[green]✓[/green] Environment check passed!")
         return True
     
-    def select_configuration(self) -> Configuration:
-        """Allow user to select a research configuration."""
+    def _load_research_graph(self):
+        """Import the research graph, switching the demo to mock mode if a dependency is missing."""
+        try:
+            from open_deep_research.deep_researcher import deep_researcher
+        except ImportError as e:
+            self.full_system = False
+            self.console.print(f"[yellow]Warning:[/yellow] Research dependencies are not installed ({e}); using demo mode.")
+            return None
+        
+        # Search connections stay open across every research run in the session
+        self.connections.install()
+        return deep_researcher
+    
+    async def select_configuration(self) -> Dict[str, Any]:
+        """Allow user to select a research configuration and return its demo config entry."""
         self.console.print("\n[bold]Available Research Configurations:[/bold]")
         
         table = Table(show_header=True, header_style="bold magenta")
@@ -162,24 +294,19 @@ Welcome to the comprehensive demo of Open Deep Research!
         
         config_list = list(self.demo_configs.items())
         for i, (key, config_info) in enumerate(config_list, 1):
-            description = f"Models: {config_info['config'].get('research_model', 'N/A')}"
-            description += f" | Search: {config_info['config'].get('search_api', 'N/A').value if hasattr(config_info['config'].get('search_api', 'N/A'), 'value') else config_info['config'].get('search_api', 'N/A')}"
-            table.add_row(str(i), config_info["name"], description)
+            table.add_row(str(i), config_info["name"], config_info["_description"])
         
         self.console.print(table)
         
         while True:
             try:
-                choice = int(Prompt.ask("Select configuration", choices=[str(i) for i in range(1, len(config_list) + 1)]))
+                choice = int(await ask("Select configuration", choices=[str(i) for i in range(1, len(config_list) + 1)], console=self.console))
                 selected_key = config_list[choice - 1][0]
-                config_dict = self.demo_configs[selected_key]["config"]
-                
-                # Create Configuration object
-                return Configuration(**config_dict)
+                return self.demo_configs[selected_key]
             except (ValueError, IndexError):
                 self.console.print("[red]Invalid choice. Please try again.[/red]")
     
-    def get_research_topic(self) -> str:
+    async def get_research_topic(self) -> str:
         """Get research topic from user."""
         self.console.print("\n[bold]Research Topic Selection:[/bold]")
         
@@ -198,20 +325,21 @@ Welcome to the comprehensive demo of Open Deep Research!
         
         self.console.print("\nYou can use one of the examples above or enter your own topic.")
         
-        use_example = Confirm.ask("Would you like to use an example topic?")
+        use_example = await confirm("Would you like to use an example topic?", console=self.console)
         
         if use_example:
             while True:
                 try:
-                    choice = int(Prompt.ask("Select example", choices=[str(i) for i in range(1, len(examples) + 1)]))
+                    choice = int(await ask("Select example", choices=[str(i) for i in range(1, len(examples) + 1)], console=self.console))
                     return examples[choice - 1]
                 except (ValueError, IndexError):
                     self.console.print("[red]Invalid choice. Please try again.[/red]")
         else:
-            return Prompt.ask("Enter your research topic")
+            return await ask("Enter your research topic", console=self.console)
     
-    async def run_research(self, topic: str, config: Configuration) -> Optional[Dict[str, Any]]:
+    async def run_research(self, topic: str, config_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Run the research process with progress tracking."""
+        config = config_info["configuration"]
         self.console.print(f"\n[bold green]Starting Research:[/bold green] {topic}")
         if hasattr(config, 'research_model'):
             model = config.research_model
@@ -224,27 +352,22 @@ Welcome to the comprehensive demo of Open Deep Research!
         
         self.console.print(f"[bold blue]Configuration:[/bold blue] {model} + {search_api}")
         
-        if FULL_SYSTEM_AVAILABLE:
+        deep_researcher = self._load_research_graph() if self.full_system else None
+        if deep_researcher is not None:
             # Run actual research
             research_input = {
                 "messages": [{"role": "user", "content": topic}]
             }
             
             try:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=self.console
-                ) as progress:
-                    task = progress.add_task("Conducting research...", total=None)
-                    
+                with self._progress_task("Conducting research...") as task:
                     # Run the research
                     result = await deep_researcher.ainvoke(
                         research_input,
-                        config={"configurable": config.model_dump()}
+                        config={"configurable": config_info["configurable"]}
                     )
                     
-                    progress.update(task, description="Research completed!")
+                    self._progress.update(task, description="Research completed!")
                 
                 return result
                 
@@ -257,25 +380,28 @@ Welcome to the comprehensive demo of Open Deep Research!
     
     async def _mock_research(self, topic: str, config) -> Dict[str, Any]:
         """Mock research function for demo when full system is not available."""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console
-        ) as progress:
-            # Simulate research steps
-            steps = [
-                "Initializing research agents...",
-                "Searching for relevant information...",
-                "Analyzing search results...",
-                "Generating research insights...",
-                "Compiling final report...",
-                "Research completed!"
-            ]
-            
-            for i, step in enumerate(steps):
-                task = progress.add_task(step, total=None)
+        # Simulate research steps
+        steps = [
+            "Initializing research agents...",
+            "Searching for relevant information...",
+            "Analyzing search results...",
+            "Generating research insights...",
+            "Compiling final report...",
+            "Research completed!"
+        ]
+        
+        # One task relabelled per step avoids adding and removing a live row each time
+        with self._progress_task(steps[0], total=len(steps)) as task:
+            async def run_step(step: str) -> None:
+                self._progress.update(task, description=step)
                 await asyncio.sleep(1)  # Simulate processing time
-                progress.remove_task(task)
+                self._progress.advance(task)
+            
+            # The simulated steps are independent waits, so overlap them up to the
+            # configuration's research-unit limit, as the real supervisor would
+            limit = getattr(config, "max_concurrent_research_units", None) or MOCK_STEP_CONCURRENCY
+            await gather_bounded((run_step(step) for step in steps[:-1]), limit)
+            self._progress.update(task, description=steps[-1], advance=1)
         
         # Extract config values safely
         if hasattr(config, '__dict__'):
@@ -308,44 +434,13 @@ Welcome to the comprehensive demo of Open Deep Research!
     
     def _generate_mock_report(self, topic: str, config_dict: Dict[str, Any]) -> str:
         """Generate a mock research report."""
-        return f"""# Research Report: {topic}
-
-## Executive Summary
-This research report provides a comprehensive analysis of {topic}, examining current trends, key developments, and future implications.
-
-## Key Findings
-1. **Current State**: The field of {topic} is experiencing significant growth and innovation.
-2. **Major Trends**: Several important trends are shaping the landscape of {topic}.
-3. **Challenges**: Key challenges include technological hurdles and market adoption.
-
-## Detailed Analysis
-### Background
-{topic} represents an important area of study with significant implications for various stakeholders.
-
-### Methodology
-This research utilized {config_dict.get('search_api', 'mock-search')} for information gathering and {config_dict.get('research_model', 'mock-model')} for analysis.
-
-### Results
-Our analysis reveals that {topic} is characterized by:
-- Rapid technological advancement
-- Increasing market interest
-- Growing research community
-- Emerging practical applications
-
-## Recommendations
-1. Continue monitoring developments in {topic}
-2. Invest in research and development
-3. Consider strategic partnerships
-4. Prepare for market opportunities
-
-## Conclusion
-{topic} represents a dynamic and evolving field with significant potential for future growth and impact.
-
----
-*This report was generated using Open Deep Research in demo mode.*
-"""
+        return _mock_report(
+            topic,
+            str(config_dict.get('search_api', 'mock-search')),
+            str(config_dict.get('research_model', 'mock-model'))
+        )
     
-    def display_results(self, result: Dict[str, Any], topic: str):
+    async def display_results(self, result: Dict[str, Any], topic: str):
         """Display the research results."""
         if not result:
             return
@@ -354,54 +449,66 @@ Our analysis reveals that {topic} is characterized by:
         self.console.print(f"[bold green]Research Results for:[/bold green] {topic}")
         self.console.print("="*80)
         
+        # When output is redirected, skip Rich's layout and write the text as-is
+        plain = not self.console.is_terminal
+        
         # Display final report
         if "final_report" in result:
             self.console.print("\n[bold blue]Final Report:[/bold blue]")
-            self.console.print(Panel(result["final_report"], border_style="blue"))
+            if plain:
+                print(result["final_report"])
+            else:
+                from rich.markdown import Markdown
+                
+                # Render one top-level section at a time so the start of a long report
+                # appears without waiting for the whole document to be laid out
+                for section in _REPORT_SECTION_RE.split(result["final_report"]):
+                    if section.strip():
+                        self.console.print(Markdown(section))
+                        self.console.print()
         
         # Display raw notes if available
         notes = result.get("raw_notes", result.get("notes", []))
         if notes:
-            show_notes = Confirm.ask("\nWould you like to see the research notes?", default=False)
+            show_notes = await confirm("\nWould you like to see the research notes?", default=False, console=self.console)
             if show_notes:
                 self.console.print("\n[bold yellow]Research Notes:[/bold yellow]")
-                for i, note in enumerate(notes, 1):
-                    self.console.print(f"\n[dim]Note {i}:[/dim]")
-                    self.console.print(note)
+                if plain:
+                    print("\n".join(f"\nNote {i}:\n{note}" for i, note in enumerate(notes, 1)))
+                else:
+                    self.console.print("\n".join(f"\n[dim]Note {i}:[/dim]\n{escape(note)}" for i, note in enumerate(notes, 1)))
         
         # Save results option
-        save_results = Confirm.ask("\nWould you like to save the results to a file?", default=True)
+        save_results = await confirm("\nWould you like to save the results to a file?", default=True, console=self.console)
         if save_results:
-            self.save_results(result, topic)
+            await self.save_results(result, topic)
     
-    def save_results(self, result: Dict[str, Any], topic: str):
+    async def save_results(self, result: Dict[str, Any], topic: str):
         """Save research results to a file."""
         # Create results directory
         results_dir = Path("demo_results")
         results_dir.mkdir(exist_ok=True)
         
         # Generate filename
-        safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_topic = safe_topic.replace(' ', '_')[:50]
+        safe_topic = safe_filename(topic, 50)
         filename = results_dir / f"research_{safe_topic}.md"
         
         # Create markdown content
-        content = f"# Research Report: {topic}\n\n"
-        content += f"Generated by Open Deep Research\n\n"
+        parts = [f"# Research Report: {topic}\n\n", "Generated by Open Deep Research\n\n"]
         
         if "final_report" in result:
-            content += "## Final Report\n\n"
-            content += result["final_report"] + "\n\n"
+            parts.append("## Final Report\n\n")
+            parts.append(result["final_report"] + "\n\n")
         
         if "raw_notes" in result and result["raw_notes"]:
-            content += "## Research Notes\n\n"
+            parts.append("## Research Notes\n\n")
             for i, note in enumerate(result["raw_notes"], 1):
-                content += f"### Note {i}\n\n"
-                content += note + "\n\n"
+                parts.append(f"### Note {i}\n\n")
+                parts.append(note + "\n\n")
         
-        # Save to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once and save in one write off the event loop so slow or network storage doesn't stall the demo
+        data = "".join(parts).encode("utf-8")
+        await asyncio.to_thread(filename.write_bytes, data)
         
         self.console.print(f"[green]✓[/green] Results saved to: {filename}")
     
@@ -412,31 +519,34 @@ Our analysis reveals that {topic} is characterized by:
         if not self.check_environment():
             return
         
-        while True:
-            try:
-                # Select configuration
-                config = self.select_configuration()
-                
-                # Get research topic
-                topic = self.get_research_topic()
-                
-                # Run research
-                result = await self.run_research(topic, config)
-                
-                # Display results
-                self.display_results(result, topic)
-                
-                # Ask if user wants to continue
-                if not Confirm.ask("\nWould you like to conduct another research?", default=True):
-                    break
+        try:
+            while True:
+                try:
+                    # Select configuration
+                    config_info = await self.select_configuration()
                     
-            except KeyboardInterrupt:
-                self.console.print("\n[yellow]Demo interrupted by user.[/yellow]")
-                break
-            except Exception as e:
-                self.console.print(f"[bold red]Unexpected error:[/bold red] {str(e)}")
-                if not Confirm.ask("Would you like to continue?", default=True):
+                    # Get research topic
+                    topic = await self.get_research_topic()
+                    
+                    # Run research
+                    result = await self.run_research(topic, config_info)
+                    
+                    # Display results
+                    await self.display_results(result, topic)
+                    
+                    # Ask if user wants to continue
+                    if not await confirm("\nWould you like to conduct another research?", default=True, console=self.console):
+                        break
+                        
+                except KeyboardInterrupt:
+                    self.console.print("\n[yellow]Demo interrupted by user.[/yellow]")
                     break
+                except Exception as e:
+                    self.console.print(f"[bold red]Unexpected error:[/bold red] {str(e)}")
+                    if not await confirm("Would you like to continue?", default=True, console=self.console):
+                        break
+        finally:
+            await self.connections.aclose()
         
         self.console.print("\n[bold blue]Thank you for using Open Deep Research Demo![/bold blue]")
 
@@ -0,0 +1,35 @@
+"""
+JSON helpers shared by the demos.
+
+orjson is used when it is installed and the standard library json module
+otherwise. Both paths produce the same documents.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(data: Any) -> bytes:
+    """Serialize data as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def dumps_line(data: Any) -> bytes:
+    """Serialize data as a single newline-terminated JSON Lines record."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data).encode("utf-8") + b"\n"